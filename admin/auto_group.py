@@ -1,11 +1,32 @@
 import streamlit as st
 import pandas as pd
-import string
-from contextlib import closing
+import numpy as np
 from utils import get_db_connection
+from cache_utils import bump_event_version
+from admin.bulk_write import apply_bulk_update
+from admin.ratings import fetch_ratings
+from engine.draw import draw_groups, group_labels
+from engine.rating import INITIAL_RATING
 
-def render(event_id, user_email):
-    with st.expander("🎯 Auto Grouping"):
+MAX_GROUPS = 32
+DRAW_CANDIDATES = 5
+
+
+def draw_strength(df: pd.DataFrame, ratings: dict | None = None) -> np.ndarray:
+    """Higher is stronger.
+
+    With ``ratings`` players are ordered by rating (unrated players get the
+    starting rating); otherwise seeded players in seed order go ahead of
+    everyone unseeded.
+    """
+    if ratings:
+        return df["user_id"].map(ratings).fillna(INITIAL_RATING).to_numpy(dtype=float)
+    seed = pd.to_numeric(df["seed_no"], errors="coerce").fillna(0).to_numpy()
+    return np.where(seed > 0, 1 + seed.max(initial=0) - seed, 0.0)
+
+
+def render(event_id, user_email, expanded=False):
+    with st.expander("🎯 Auto Grouping", expanded=expanded):
         st.session_state.setdefault("selected_competition", "open")
 
         # ── 1. fetch competitions & registrations ────────────────────────
@@ -38,8 +59,9 @@ def render(event_id, user_email):
                        club_name, club_code, seed_no, group_no
                 FROM event_registration_v
                 WHERE event_id = %s AND competition_type = %s
+                  AND id NOT IN (SELECT id FROM event_registration WHERE event_id = %s AND reg_status = 'waitlist')
                 ORDER BY last_name, first_name
-            """, (event_id, selected_comp))
+            """, (event_id, selected_comp, event_id))
             rows = cur.fetchall()
             cols = [d[0].lower() for d in cur.description]   # <-- keep lower‑case
             df   = pd.DataFrame(rows, columns=cols)
@@ -55,64 +77,59 @@ def render(event_id, user_email):
             return
 
         # ── 2. UI controls ───────────────────────────────────────────────
-        num_groups = st.selectbox("Select number of groups", list(range(2, 32)), index=2)
+        c1, c2 = st.columns(2)
+        num_groups = c1.selectbox("Select number of groups", list(range(2, MAX_GROUPS + 1)), index=2)
+        n_candidates = c2.number_input("Candidate draws", min_value=1, max_value=20, value=DRAW_CANDIDATES)
+        use_ratings = st.toggle("Balance groups by player rating", value=True)
+        draw_key = f"group_draws_{event_id}_{selected_comp}"
+
+        # ── 3. Draw candidates ──────────────────────────────────────────
+        if st.button("🎲 Draw Groups"):
+            strength = draw_strength(df, fetch_ratings(df["user_id"]) if use_ratings else None)
+            st.session_state[draw_key] = {
+                "ids": df["id"].to_numpy(),
+                "num_groups": num_groups,
+                "draws": [
+                    draw_groups(strength, num_groups, club=df["club_code"].to_numpy(), rng=k)
+                    for k in np.random.default_rng().integers(0, 2**31, int(n_candidates))
+                ],
+            }
+
+        drawn = st.session_state.get(draw_key)
+        if not drawn or len(drawn["ids"]) != len(df) or (drawn["ids"] != df["id"].to_numpy()).any():
+            return
 
-        # ── 3. Auto‑assign button logic ─────────────────────────────────
-        if st.button("🎲 Auto‑Assign Competitors to Groups"):
+        metrics = pd.DataFrame([
+            {"draw": k + 1, "club clashes": d.metrics.club_clashes,
+             "strength spread": round(d.metrics.strength_spread, 2),
+             "strength std": round(d.metrics.strength_std, 2),
+             "size range": d.metrics.size_range}
+            for k, d in enumerate(drawn["draws"])
+        ])
+        st.dataframe(metrics, use_container_width=True, hide_index=True)
+        best = int(metrics.sort_values(["club clashes", "strength std"]).index[0])
+        choice = st.selectbox("Draw to keep", list(range(len(drawn["draws"]))), index=best,
+                              format_func=lambda k: f"draw {k + 1}")
+
+        labels = np.array(group_labels(drawn["num_groups"]))
+        final_df = df.assign(group_no=labels[drawn["draws"][choice].group])
+        final_df = final_df.sort_values(["group_no", "seed_no", "last_name"]).reset_index(drop=True)
+        st.dataframe(
+            final_df[["group_no", "first_name", "last_name", "club_code", "seed_no"]],
+            use_container_width=True, hide_index=True,
+        )
+
+        # ── 4. Write back to DB (one statement per chunk) ──────────────
+        if st.button("💾 Save Draw"):
             try:
-                df_work = df.copy()
-                df_work["seed_no"] = (
-                    pd.to_numeric(df_work["seed_no"], errors="coerce")
-                    .fillna(0)
-                    .astype(int)
-                )
-
-                seeded    = df_work[df_work["seed_no"] > 0].sort_values("seed_no")
-                unseeded  = df_work[df_work["seed_no"] == 0].sample(frac=1)
-                labels    = list(string.ascii_uppercase[:num_groups])
-                buckets   = {lbl: [] for lbl in labels}
-
-                # round‑robin the seeded players
-                for i, (_, row) in enumerate(seeded.iterrows()):
-                    buckets[labels[i % num_groups]].append(row)
-
-                # then distribute unseeded to keep counts even
-                counts = {lbl: len(buckets[lbl]) for lbl in labels}
-                for _, row in unseeded.iterrows():
-                    tgt = min(counts, key=counts.get)
-                    buckets[tgt].append(row)
-                    counts[tgt] += 1
-
-                # flatten back out
-                final_rows = []
-                for lbl in labels:
-                    for row in buckets[lbl]:
-                        row["group_no"] = lbl
-                        final_rows.append(row)
-
-                final_df = (
-                    pd.DataFrame(final_rows)
-                    .sort_values(["group_no", "seed_no", "last_name"])
-                    .reset_index(drop=True)
+                updated = apply_bulk_update(
+                    "event_registration", "id", ("group_no",),
+                    zip(final_df["id"].astype(int).tolist(), final_df["group_no"].tolist()),
+                    extra_set="t.updated_timestamp = current_timestamp",
                 )
+                bump_event_version(event_id)
                 st.session_state.final_group_df = final_df
-
-                # ── 4. Write back to DB ────────────────────────────────
-                with closing(get_db_connection()) as conn, closing(conn.cursor()) as cur:
-                    for _, row in final_df.iterrows():
-                        cur.execute("""
-                            UPDATE event_registration
-                            SET group_no = %s,
-                                updated_timestamp = CURRENT_TIMESTAMP
-                            WHERE id = %s
-                        """, (row["group_no"], row["id"]))
-                    conn.commit()
-
-                st.success(f"✅ {len(final_df)} participants assigned and saved to DB.")
-                st.dataframe(
-                    final_df[["first_name", "last_name", "seed_no", "group_no"]],
-                    use_container_width=True
-                )
-
+                st.session_state.pop(draw_key, None)
+                st.success(f"✅ {len(final_df)} participants assigned ({updated} changed) and saved to DB.")
             except Exception as exc:
                 st.error(f"❌ Grouping or DB update error: {exc}")
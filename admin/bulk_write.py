@@ -0,0 +1,120 @@
+from contextlib import closing
+from utils import get_db_connection
+
+# Rows per INSERT statement; keeps each packet well under max_allowed_packet
+BULK_CHUNK_SIZE = 500
+
+
+def rows_from_columns(columns, data: dict) -> list:
+    """Zip a {column: array | scalar} mapping into tuples in ``columns`` order.
+
+    Scalars are repeated; NumPy arrays go through ``tolist()`` so the driver
+    receives plain Python values.
+    """
+    lengths = {
+        len(v) for v in data.values()
+        if hasattr(v, "__len__") and not isinstance(v, (str, bytes))
+    }
+    if len(lengths) > 1:
+        raise ValueError(f"column lengths differ: {sorted(lengths)}")
+    n = lengths.pop() if lengths else 1
+
+    cols = []
+    for c in columns:
+        v = data[c]
+        if isinstance(v, (str, bytes)) or not hasattr(v, "__len__"):
+            cols.append([v] * n)
+        else:
+            cols.append(v.tolist() if hasattr(v, "tolist") else list(v))
+    return list(zip(*cols))
+
+
+def insert_many(cur, table: str, columns, rows, chunk_size: int = BULK_CHUNK_SIZE) -> int:
+    """Multi-row INSERTs on the caller's cursor, without committing.
+
+    ``rows`` may be dicts keyed by column name or sequences in ``columns``
+    order.  mysql.connector turns ``executemany`` on an INSERT into a single
+    multi-row VALUES statement, so each chunk is one round trip.
+    """
+    columns = list(columns)
+    values = [
+        tuple(row[c] for c in columns) if isinstance(row, dict) else tuple(row)
+        for row in rows
+    ]
+    sql = (
+        f"insert into {table} ({', '.join(columns)}) "
+        f"values ({', '.join(['%s'] * len(columns))})"
+    )
+    for start in range(0, len(values), chunk_size):
+        cur.executemany(sql, values[start:start + chunk_size])
+    return len(values)
+
+
+def bulk_insert(conn, table: str, columns, rows, chunk_size: int = BULK_CHUNK_SIZE) -> int:
+    """Insert ``rows`` into ``table`` in one transaction and return the row count."""
+    rows = list(rows)
+    if not rows:
+        return 0
+    try:
+        with closing(conn.cursor()) as cur:
+            written = insert_many(cur, table, columns, rows, chunk_size)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return written
+
+
+def bulk_update(cur, table: str, key: str, columns, rows, extra_set: str = "",
+                match_columns=(), chunk_size: int = BULK_CHUNK_SIZE) -> int:
+    """Set-based UPDATE of many rows; returns the affected row count.
+
+    ``rows`` are ``(key, *columns, *match_columns)`` tuples.  Each chunk
+    becomes one ``UPDATE ... JOIN (SELECT .. UNION ALL ..)`` statement.
+    ``match_columns`` are compared rather than set (compare-and-set, e.g. a
+    row version).  ``extra_set`` is appended to the SET list (e.g.
+    ``"t.updated_timestamp = current_timestamp"``).  Runs on the caller's
+    cursor and does not commit, so it can share a transaction with other
+    writes.
+    """
+    columns, match_columns = list(columns), list(match_columns)
+    rows = [tuple(r) for r in rows]
+    if not rows:
+        return 0
+
+    names = [key] + columns + match_columns
+    first = "select " + ", ".join(f"%s as {n}" for n in names)
+    other = "select " + ", ".join(["%s"] * len(names))
+    on = " and ".join(f"t.{c} = s.{c}" for c in [key] + match_columns)
+    assignments = [f"t.{c} = s.{c}" for c in columns]
+    if extra_set:
+        assignments.append(extra_set)
+
+    affected = 0
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        derived = " union all ".join([first] + [other] * (len(chunk) - 1))
+        cur.execute(
+            f"update {table} t join ({derived}) s on {on} "
+            f"set {', '.join(assignments)}",
+            [v for row in chunk for v in row],
+        )
+        affected += max(cur.rowcount, 0)
+    return affected
+
+
+def apply_bulk_update(table: str, key: str, columns, rows, extra_set: str = "",
+                      chunk_size: int = BULK_CHUNK_SIZE) -> int:
+    """``bulk_update`` on its own connection, committed as one transaction.
+
+    For admin editors that stage ``(key, *columns)`` tuples and save them in
+    one go; returns the number of rows actually changed.
+    """
+    with closing(get_db_connection()) as conn, closing(conn.cursor()) as cur:
+        try:
+            affected = bulk_update(cur, table, key, columns, rows, extra_set=extra_set, chunk_size=chunk_size)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    return affected
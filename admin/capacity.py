@@ -0,0 +1,72 @@
+import streamlit as st
+import pandas as pd
+from contextlib import closing
+from utils import get_db_connection
+from cache_utils import bump_event_version
+from admin.bulk_write import bulk_insert
+
+COMPETITIONS = ("Open", "Women", "Junior", "Veteran", "Teams")
+
+
+def fetch_capacity(event_id: int) -> pd.DataFrame:
+    """Capacity and registered / waitlisted counts per competition (blank capacity = unlimited)."""
+    with closing(get_db_connection()) as conn, closing(conn.cursor()) as cur:
+        cur.execute(
+            """
+            select c.competition_type, cap.capacity,
+                   coalesce(sum(r.reg_status = 'registered'), 0) as registered,
+                   coalesce(sum(r.reg_status = 'waitlist'), 0) as waitlist
+            from (
+                select competition_type from event_competition_capacity where event_id = %s
+                union
+                select competition_type from event_registration where event_id = %s
+            ) c
+            left join event_competition_capacity cap
+              on cap.event_id = %s and cap.competition_type = c.competition_type
+            left join event_registration r
+              on r.event_id = %s and r.competition_type = c.competition_type
+            group by c.competition_type, cap.capacity
+            """,
+            (event_id,) * 4,
+        )
+        df = pd.DataFrame(cur.fetchall(), columns=["competition_type", "capacity", "registered", "waitlist"])
+    missing = [c for c in COMPETITIONS if c not in set(df["competition_type"])]
+    df = pd.concat([df, pd.DataFrame({"competition_type": missing})], ignore_index=True)
+    df["capacity"] = pd.to_numeric(df["capacity"], errors="coerce").astype("Int64")
+    return df.fillna({"registered": 0, "waitlist": 0})
+
+
+def save_capacity(event_id: int, df: pd.DataFrame) -> int:
+    limited = df[df["capacity"].notna()]
+    with closing(get_db_connection()) as conn:
+        with closing(conn.cursor()) as cur:
+            cur.execute("delete from event_competition_capacity where event_id = %s", (event_id,))
+        written = bulk_insert(
+            conn, "event_competition_capacity", ("event_id", "competition_type", "capacity"),
+            [(event_id, c, int(n)) for c, n in zip(limited["competition_type"], limited["capacity"])],
+        )
+        conn.commit()
+    bump_event_version(event_id)
+    return written
+
+
+def render(event_id: int, expanded: bool = False):
+    with st.expander("🎟️ Competition Capacity", expanded=expanded):
+        st.caption("registrations beyond a competition's capacity go on its waitlist; blank = unlimited.")
+        df = fetch_capacity(event_id)
+        edited = st.data_editor(
+            df,
+            column_config={
+                "capacity": st.column_config.NumberColumn("capacity", min_value=0, step=1, format="%d"),
+            },
+            disabled=["competition_type", "registered", "waitlist"],
+            use_container_width=True,
+            hide_index=True,
+            key=f"capacity_editor_{event_id}",
+        )
+        if st.button("💾 Save Capacity"):
+            try:
+                written = save_capacity(event_id, edited)
+                st.success(f"✅ capacity saved for {written} competition(s).")
+            except Exception as exc:
+                st.error(f"❌ failed to save capacity: {exc}")
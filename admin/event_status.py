@@ -1,5 +1,6 @@
 import streamlit as st
 from utils import get_db_connection
+from cache_utils import bump_event_version
 
 def render(event_id, event_status, user_email):
     cols = st.columns(5)  
@@ -31,6 +32,7 @@ def update_status(event_id, user_email, new_status):
             WHERE id = %s
         """, (new_status, user_email, event_id))
         conn.commit()
+        bump_event_version(event_id)
         st.success(f"✅ Event status updated to '{new_status}'.")
         st.rerun()
     except Exception as e:
@@ -1,54 +1,107 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import string
 import random
 from contextlib import closing
 from utils import get_db_connection
+from cache_utils import bump_event_version, get_bracket_templates
+from admin.bulk_write import bulk_update, insert_many, rows_from_columns
+from admin.standings import apply_standings_delta, rebuild_standings
+from admin.ratings import apply_rating_updates, undo_rating_updates
+from engine.round_robin import round_robin
+from engine.swiss import pair_round
+
+MATCH_COLUMNS = (
+    "event_id", "competition_type", "group_no",
+    "round_type", "round_no",
+    "player_1_id", "player_1_club_id",
+    "player_2_id", "player_2_club_id",
+    "status",
+)
+
+# group_no of Swiss-format matches; they are ordinary 'group' rounds, so the
+# standings view tables them as one group
+SWISS_GROUP = "Swiss"
 
 # ─────────────────────────────────────────────────────────────────────────────
 def generate_knockout_placeholders(num_groups: int):
-    """Return (round_type, group_no, p1_id, p2_id) rows for the given group count."""
-    with closing(get_db_connection()) as conn, closing(conn.cursor()) as cur:
-        cur.execute(
-            """
-            select round_type, group_no, p1_id, p2_id
-            from knockout_matches
-            where %s between min_group and max_group
-            order by id
-            """,
-            (num_groups,),
-        )
-        return cur.fetchall()            # already tuples
+    """Return (round_type, group_no, p1_id, p2_id) rows for the given group count, in stage order."""
+    return list(get_bracket_templates().for_groups(num_groups))
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-def update_knockout_placeholders(event_id: int) -> bool:
-    """Replace placeholder IDs with real winners once scores are final."""
-    sql_1 = """
-        update event_matches em
-        join event_ko_round_v ek
-          on em.event_id = ek.event_id
-         and em.competition_type = ek.competition_type
-         and em.player_1_id = ek.placeholder_id
-        set em.player_1_id = ek.player_id,
-            em.player_1_club_id = ek.club_id,
-            em.status = case when em.player_2_id > 0 then 'scheduled' else em.status end,
-            em.updated_timestamp = current_timestamp
-        where em.event_id = %s
-          and em.status <> 'final'
+KO_ADVANCE_SQL = """
+    update event_matches em
+    join event_ko_round_v ek
+      on em.event_id = ek.event_id
+     and em.competition_type = ek.competition_type
+     and em.player_{side}_id = ek.placeholder_id
+    set em.player_{side}_id = ek.player_id,
+        em.player_{side}_club_id = ek.club_id,
+        em.status = case when em.player_{other}_id > 0 then 'scheduled' else em.status end,
+        em.version = em.version + 1,
+        em.updated_timestamp = current_timestamp
+    where em.event_id = %s
+      and em.status <> 'final'
+      {scope}
+"""
+
+
+def decidable_competitions(cur, match_ids) -> list:
+    """(event_id, competition_type) pairs whose bracket can move after ``match_ids``.
+
+    A finished knockout tie always decides a slot; a group match only does
+    once it completes its group.  Saves in the middle of a group return
+    nothing, so they never touch the knockout view.
     """
-    sql_2 = sql_1.replace("player_1_", "player_2_")  # same join, swap side
+    match_ids = [int(m) for m in match_ids]
+    if not match_ids:
+        return []
+    placeholders = ", ".join(["%s"] * len(match_ids))
+    cur.execute(
+        f"""
+        select m.event_id, m.competition_type
+        from event_matches m
+        where m.id in ({placeholders})
+          and m.status = 'final'
+          and (
+                m.round_type <> 'group'
+             or not exists (
+                    select 1
+                    from event_matches g
+                    where g.event_id = m.event_id
+                      and g.competition_type = m.competition_type
+                      and g.round_type = m.round_type
+                      and g.group_no = m.group_no
+                      and g.status <> 'final'
+                )
+          )
+        group by m.event_id, m.competition_type
+        """,
+        tuple(match_ids),
+    )
+    return cur.fetchall()
 
-    try:
-        with closing(get_db_connection()) as conn, closing(conn.cursor()) as cur:
-            cur.execute(sql_1, (event_id,))
-            cur.execute(sql_2, (event_id,))
-            conn.commit()
-        st.success("✅ knockout placeholders filled where possible.")
-        return True
-    except Exception as exc:
-        st.error(f"❌ failed to replace knockout placeholders: {exc}")
-        return False
+
+def advance_knockout(cur, match_ids) -> int:
+    """Fill bracket slots made decidable by the just-finalized ``match_ids``.
+
+    Runs on the caller's cursor (and transaction).  Only unresolved slots
+    (placeholder ids are <= 0) of the affected competitions are updated, each
+    with the player and club that ``event_ko_round_v`` resolves for its
+    placeholder.  Returns the number of slots filled.
+    """
+    filled = 0
+    for event_id, comp in decidable_competitions(cur, match_ids):
+        for side, other in (("1", "2"), ("2", "1")):
+            scope = f"and em.competition_type = %s and em.player_{side}_id <= 0"
+            cur.execute(
+                KO_ADVANCE_SQL.format(side=side, other=other, scope=scope),
+                (event_id, comp),
+            )
+            filled += max(cur.rowcount, 0)
+    return filled
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -56,11 +109,13 @@ def fetch_matches_df(event_id: int, comp: str) -> pd.DataFrame:
     with closing(get_db_connection()) as conn, closing(conn.cursor()) as cur:
         cur.execute(
             """
-            select id, competition_type, round_no, group_no,
-                   player1, player1_goals, player2_goals, player2
-            from event_matches_v
-            where event_id = %s and competition_type = %s
-            order by round_no, group_no
+            select v.id, v.competition_type, v.round_no, v.group_no,
+                   v.player1, v.player1_goals, v.player2_goals, v.player2,
+                   m.version
+            from event_matches_v v
+            join event_matches m on m.id = v.id
+            where v.event_id = %s and v.competition_type = %s
+            order by v.round_no, v.group_no, v.id
             """,
             (event_id, comp),
         )
@@ -69,13 +124,34 @@ def fetch_matches_df(event_id: int, comp: str) -> pd.DataFrame:
         return pd.DataFrame(rows, columns=cols)
 
 
+def reset_match_editor(event_id: int, comp: str):
+    """Forget the editor's snapshot and edits so the next render reloads."""
+    st.session_state.pop(f"match_snapshot_{event_id}_{comp}", None)
+    st.session_state.pop(f"match_editor_{event_id}_{comp}", None)
+    st.session_state.pop(f"match_pending_{event_id}_{comp}", None)
+
+
 def render_match_table(event_id: int, comp: str):
-    df_full = fetch_matches_df(event_id, comp)
-    if df_full.empty:
-        return None
+    # The editor works on the snapshot (and match versions) taken when it was
+    # opened, so a save can tell whether another desk changed a match since.
+    snapshot_key = f"match_snapshot_{event_id}_{comp}"
+    df_full = st.session_state.get(snapshot_key)
+    if df_full is None:
+        df_full = fetch_matches_df(event_id, comp)
+        if df_full.empty:
+            return None
+        st.session_state[snapshot_key] = df_full
 
-    # hide the DB id from users but keep for updates
-    df_display = df_full.drop(columns=["id", "competition_type"])
+    # hide the DB id / version from users but keep for updates
+    df_display = df_full.drop(columns=["id", "competition_type", "version"])
+
+    # scores refused as conflicts are shown again on the reloaded snapshot
+    pending = st.session_state.get(f"match_pending_{event_id}_{comp}") or {}
+    if pending:
+        held = df_full["id"].isin(pending)
+        goals = df_full.loc[held, "id"].map(pending)
+        df_display.loc[held, "player1_goals"] = goals.str[0]
+        df_display.loc[held, "player2_goals"] = goals.str[1]
 
     edited = st.data_editor(
         df_display,
@@ -97,14 +173,205 @@ def render_match_table(event_id: int, comp: str):
         key=f"match_editor_{event_id}_{comp}",
     )
 
-    # bring back the ID so caller can update DB
+    # bring back the ID and version so caller can update DB
     edited["id"] = df_full["id"]
+    edited["version"] = df_full["version"]
     return edited
 
 
+def edited_scores(event_id: int, comp: str, edited: pd.DataFrame) -> list:
+    """(match_id, p1_goals, p2_goals, loaded_version) for rows touched in the editor.
+
+    Reads the data_editor's ``edited_rows`` delta instead of re-querying and
+    diffing, plus any scores held over from a conflicting save; rows with a
+    goal left blank are skipped.
+    """
+    state = st.session_state.get(f"match_editor_{event_id}_{comp}") or {}
+    pending = st.session_state.get(f"match_pending_{event_id}_{comp}") or {}
+    touched = {int(p) for p in state.get("edited_rows", {})}
+    touched |= set(np.flatnonzero(edited["id"].isin(pending).to_numpy()).tolist())
+    scores = []
+    for pos in sorted(touched):
+        row = edited.iloc[pos]
+        if pd.isna(row["player1_goals"]) or pd.isna(row["player2_goals"]):
+            continue
+        scores.append((
+            int(row["id"]), int(row["player1_goals"]), int(row["player2_goals"]), int(row["version"])
+        ))
+    return scores
+
+
+def commit_scores(cur, scores, rated: bool = True) -> tuple:
+    """Compare-and-set all scores in one statement, then move the standings
+    and player ratings by each match's delta and advance the bracket.
+
+    The touched rows are locked (row locks only) and their versions compared
+    with the ones the editor loaded; matches changed by someone else since
+    are left alone and returned as conflicts.  ``rated=False`` leaves the
+    player ratings alone and flags the rows as simulated, so a ratings
+    rebuild skips them too.  The caller commits.
+    Returns ``(matches_saved, knockout_slots_filled, conflicts)`` where each
+    conflict is ``(match_id, current_p1_goals, current_p2_goals)``.
+    """
+    if not scores:
+        return 0, 0, []
+    placeholders = ", ".join(["%s"] * len(scores))
+    cur.execute(
+        f"""
+        select id, version, p1_goals, p2_goals,
+               event_id, competition_type, group_no, round_type, player_1_id, player_2_id, status
+        from event_matches
+        where id in ({placeholders})
+        for update
+        """,
+        [match_id for match_id, *_ in scores],
+    )
+    locked = cur.fetchall()
+    current = {row[0]: row[1:4] for row in locked}
+
+    fresh = [s for s in scores if s[0] in current and current[s[0]][0] == s[3]]
+    conflicts = [
+        (s[0], *current[s[0]][1:]) if s[0] in current else (s[0], None, None)
+        for s in scores if s not in fresh
+    ]
+
+    saved = bulk_update(
+        cur, "event_matches", "id", ("p1_goals", "p2_goals"), fresh,
+        match_columns=("version",),
+        extra_set="t.status = 'final', t.version = t.version + 1, "
+                  f"t.simulated = {int(not rated)}, t.updated_timestamp = current_timestamp",
+    )
+    before = [(r[0], *r[4:10], r[10], r[2], r[3]) for r in locked]
+    after = {match_id: (p1, p2) for match_id, p1, p2, _ in fresh}
+    apply_standings_delta(cur, before, after)
+    if rated:
+        apply_rating_updates(cur, before, after)
+    filled = advance_knockout(cur, [match_id for match_id, *_ in fresh])
+    return saved, filled, conflicts
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+def swiss_state(cur, event_id: int, comp: str):
+    """Registrations (seed order) with their Swiss score, home count and bye flag.
+
+    Wins score 3, draws 1.  A player with fewer games than completed rounds
+    has had a bye (byes score nothing).  Also returns the played pairs as
+    positions, the number of rounds so far and whether one is still open.
+    """
+    cur.execute(
+        """
+        select user_id, club_id
+        from event_registration
+        where event_id = %s and competition_type = %s and reg_status = 'registered'
+        order by seed_no is null, seed_no, id
+        """,
+        (event_id, comp),
+    )
+    reg = pd.DataFrame(cur.fetchall(), columns=["user_id", "club_id"])
+    cur.execute(
+        """
+        select round_no, player_1_id, player_2_id, p1_goals, p2_goals, status
+        from event_matches
+        where event_id = %s and competition_type = %s and group_no = %s
+        """,
+        (event_id, comp, SWISS_GROUP),
+    )
+    matches = pd.DataFrame(
+        cur.fetchall(),
+        columns=["round_no", "player_1_id", "player_2_id", "p1_goals", "p2_goals", "status"],
+    )
+
+    n = len(reg)
+    pos = pd.Series(range(n), index=reg["user_id"].to_numpy())
+    a = matches["player_1_id"].map(pos).to_numpy()
+    b = matches["player_2_id"].map(pos).to_numpy()
+    known = ~(pd.isna(a) | pd.isna(b))
+    a, b = a[known].astype(int), b[known].astype(int)
+    done = matches.loc[known, "status"].eq("final").to_numpy()
+    g1 = pd.to_numeric(matches.loc[known, "p1_goals"]).fillna(0).to_numpy()
+    g2 = pd.to_numeric(matches.loc[known, "p2_goals"]).fillna(0).to_numpy()
+
+    score = np.zeros(n)
+    np.add.at(score, a[done], np.where(g1 > g2, 3, g1 == g2)[done])
+    np.add.at(score, b[done], np.where(g2 > g1, 3, g1 == g2)[done])
+    games = np.bincount(np.concatenate([a, b]), minlength=n)
+    rounds = int(matches["round_no"].nunique())
+
+    reg["score"] = score
+    reg["home_count"] = np.bincount(a, minlength=n)
+    reg["had_bye"] = games < rounds
+    return reg, np.column_stack([a, b]), rounds, not matches["status"].eq("final").all()
+
+
+def render_swiss_round(event_id: int, comp: str):
+    """Pair and insert the next Swiss round once the previous one is final."""
+    with closing(get_db_connection()) as conn, closing(conn.cursor()) as cur:
+        reg, played, rounds, open_round = swiss_state(cur, event_id, comp)
+
+    if len(reg) < 2:
+        st.info("ℹ️ not enough registrations to pair.")
+        return
+
+    total = st.number_input(
+        "swiss rounds", min_value=1, max_value=len(reg) - 1,
+        value=min(len(reg) - 1, max(rounds, int(np.ceil(np.log2(len(reg)))))),
+        key=f"swiss_rounds_{event_id}_{comp}",
+    )
+    st.caption(f"{rounds} of {total} round(s) paired.")
+    if open_round:
+        st.info(f"ℹ️ round {rounds} must be final before pairing the next one.")
+        return
+    if rounds >= total:
+        return
+
+    if st.button(f"♟️ Pair Round {rounds + 1}"):
+        try:
+            club_ids = reg["club_id"].astype("Int64").astype(object)
+            club_ids = club_ids.where(club_ids.notna(), None).to_numpy()
+            user_ids = reg["user_id"].to_numpy()
+            pairing = pair_round(
+                reg["score"].to_numpy(), club=club_ids, played_pairs=played,
+                had_bye=reg["had_bye"].to_numpy(), home_count=reg["home_count"].to_numpy(),
+            )
+            rows = rows_from_columns(MATCH_COLUMNS, {
+                "event_id": event_id,
+                "competition_type": comp,
+                "group_no": SWISS_GROUP,
+                "round_type": "group",
+                "round_no": rounds + 1,
+                "player_1_id": user_ids[pairing.home],
+                "player_1_club_id": club_ids[pairing.home],
+                "player_2_id": user_ids[pairing.away],
+                "player_2_club_id": club_ids[pairing.away],
+                "status": "scheduled",
+            })
+            # fixtures and their standings rows go in as one transaction
+            with closing(get_db_connection()) as conn, closing(conn.cursor()) as cur:
+                try:
+                    written = insert_many(cur, "event_matches", MATCH_COLUMNS, rows)
+                    rebuild_standings(cur, event_id, comp)
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+            bump_event_version(event_id)
+            reset_match_editor(event_id, comp)
+
+            st.success(f"✅ round {rounds + 1}: inserted {written} matches.")
+            if pairing.bye >= 0:
+                st.info(f"ℹ️ bye: player {user_ids[pairing.bye]}.")
+            if pairing.rematches or pairing.club_clashes:
+                st.warning(
+                    f"⚠️ {pairing.rematches} rematch(es), "
+                    f"{pairing.club_clashes} same-club pairing(s) could not be avoided."
+                )
+        except Exception as exc:
+            st.error(f"❌ failed to pair round: {exc}")
+
+
 # ─────────────────────────────────────────────────────────────────────────────
-def render_match_generation(event_id: int):
-    with st.expander("🎾 Match Generation & Scoring"):
+def render_match_generation(event_id: int, expanded: bool = False):
+    with st.expander("🎾 Match Generation & Scoring", expanded=expanded):
         # ---------------------------------------------------------------- comp picker
         with closing(get_db_connection()) as conn, closing(conn.cursor()) as cur:
             cur.execute(
@@ -130,14 +397,42 @@ def render_match_generation(event_id: int):
         # allow deletion / regeneration
         if match_count > 0 and st.button("🔁 Re‑Generate (delete old)"):
             with closing(get_db_connection()) as conn, closing(conn.cursor()) as cur:
+                undo_rating_updates(cur, event_id, comp)
                 cur.execute(
                     "delete from event_matches where event_id = %s and competition_type = %s",
                     (event_id, comp),
                 )
+                cur.execute(
+                    "delete from event_standings where event_id = %s and competition_type = %s",
+                    (event_id, comp),
+                )
                 conn.commit()
+            bump_event_version(event_id)
+            reset_match_editor(event_id, comp)
             st.success("old matches deleted.")
             match_count = 0
 
+        # ---------------------------------------------------------------- format
+        if match_count == 0:
+            fmt = st.radio(
+                "format", ["round robin", "swiss"], horizontal=True, key="match_gen_format",
+            )
+        else:
+            with closing(get_db_connection()) as conn, closing(conn.cursor()) as cur:
+                cur.execute(
+                    """
+                    select count(*) from event_matches
+                    where event_id = %s and competition_type = %s and group_no = %s
+                    """,
+                    (event_id, comp, SWISS_GROUP),
+                )
+                fmt = "swiss" if cur.fetchone()[0] else "round robin"
+
+        if fmt == "swiss":
+            render_swiss_round(event_id, comp)
+            render_scoring(event_id, comp)
+            return
+
         # ---------------------------------------------------------------- need group data
         with closing(get_db_connection()) as conn, closing(conn.cursor()) as cur:
             cur.execute(
@@ -145,6 +440,7 @@ def render_match_generation(event_id: int):
                 select id, user_id, club_id, group_no
                 from event_registration
                 where event_id = %s and group_no is not null and competition_type = %s
+                  and reg_status = 'registered'
                 """,
                 (event_id, comp),
             )
@@ -157,62 +453,38 @@ def render_match_generation(event_id: int):
             return
 
         # ---------------------------------------------------------------- generate button
+        legs = 1
+        if match_count == 0:
+            legs = st.radio(
+                "group legs", [1, 2], horizontal=True, key="match_gen_legs",
+                format_func=lambda n: "single round robin" if n == 1 else "double round robin",
+            )
         if match_count == 0 and st.button("⚙️ Generate Round‑Robin Matches"):
             try:
-                matches_to_insert = []
-                # === round‑robin builder (unchanged logic, but lower‑case keys) ===
-                groups = sorted(reg_df["group_no"].unique())
-                max_round = 0
-
-                for g in groups:
-                    players = (
-                        reg_df[reg_df["group_no"] == g]
-                        .sort_values("id")
-                        .to_dict("records")
-                    )
-                    if len(players) % 2:
-                        players.append(
-                            dict(id=None, user_id=-1, club_id=None, group_no=g)
-                        )
+                # === round‑robin builder ======================================
+                reg_sorted = reg_df.sort_values("id")
+                fixtures = round_robin(reg_sorted["group_no"].to_numpy(), legs=legs)
+                user_ids = reg_sorted["user_id"].to_numpy()
+                club_ids = reg_sorted["club_id"].astype("Int64").astype(object)
+                club_ids = club_ids.where(club_ids.notna(), None).to_numpy()
+                groups = fixtures.labels
+                max_round = fixtures.rounds
 
-                    n = len(players)
-                    rounds = n - 1
-                    max_round = max(max_round, rounds)
-                    half = n // 2
-                    rotation = players[:]
-
-                    for r in range(1, rounds + 1):
-                        for i in range(half):
-                            p1, p2 = rotation[i], rotation[n - 1 - i]
-                            matches_to_insert.append(
-                                dict(
-                                    event_id=event_id,
-                                    competition_type=comp,
-                                    group_no=g,
-                                    round_type="group",
-                                    round_no=r,
-                                    player_1_id=p1["user_id"],
-                                    player_1_club_id=p1["club_id"],
-                                    player_2_id=p2["user_id"],
-                                    player_2_club_id=p2["club_id"],
-                                    status="scheduled",
-                                )
-                            )
-                        rotation = [rotation[0]] + [rotation[-1]] + rotation[1:-1]
+                matches_to_insert = rows_from_columns(MATCH_COLUMNS, {
+                    "event_id": event_id,
+                    "competition_type": comp,
+                    "group_no": groups[fixtures.group],
+                    "round_type": "group",
+                    "round_no": fixtures.round_no,
+                    "player_1_id": user_ids[fixtures.home],
+                    "player_1_club_id": club_ids[fixtures.home],
+                    "player_2_id": user_ids[fixtures.away],
+                    "player_2_club_id": club_ids[fixtures.away],
+                    "status": "scheduled",
+                })
 
                 # === knockout placeholders ====================================
                 ko_placeholders = generate_knockout_placeholders(len(groups))
-                round_order = [
-                    "barrage",
-                    "round of 64",
-                    "round of 32",
-                    "round of 16",
-                    "quarter‑final",
-                    "semi‑final",
-                    "final",
-                ]
-                order_map = {rt: i for i, rt in enumerate(round_order)}
-                ko_placeholders.sort(key=lambda x: order_map.get(x[0], 999))
 
                 ko_round_no = max_round
                 ko_round_map = {}
@@ -235,100 +507,89 @@ def render_match_generation(event_id: int):
                         )
                     )
 
-                # === bulk insert =============================================
+                # === bulk insert, standings seeded in the same transaction ===
                 with closing(get_db_connection()) as conn, closing(conn.cursor()) as cur:
-                    for row in matches_to_insert:
-                        cur.execute(
-                            """
-                            insert into event_matches (
-                                event_id, competition_type, group_no,
-                                round_type, round_no,
-                                player_1_id, player_1_club_id,
-                                player_2_id, player_2_club_id,
-                                status
-                            )
-                            values (%(event_id)s, %(competition_type)s, %(group_no)s,
-                                    %(round_type)s, %(round_no)s,
-                                    %(player_1_id)s, %(player_1_club_id)s,
-                                    %(player_2_id)s, %(player_2_club_id)s,
-                                    %(status)s)
-                            """,
-                            row,
-                        )
-                    conn.commit()
+                    try:
+                        written = insert_many(cur, "event_matches", MATCH_COLUMNS, matches_to_insert)
+                        rebuild_standings(cur, event_id, comp)
+                        conn.commit()
+                    except Exception:
+                        conn.rollback()
+                        raise
+                bump_event_version(event_id)
+                reset_match_editor(event_id, comp)
 
-                st.success(f"✅ inserted {len(matches_to_insert)} matches.")
+                st.success(f"✅ inserted {written} matches.")
             except Exception as exc:
                 st.error(f"❌ failed to insert matches: {exc}")
 
-        # ---------------------------------------------------------------- scoring table
-        edited_df = render_match_table(event_id, comp)
-        if edited_df is not None:
-            st.session_state["match_df"] = edited_df
-
-        # ---------------------------------------------------------------- save scores
-        if edited_df is not None and st.button("💾 Save Scores"):
-            changed = edited_df.copy()
-            orig = fetch_matches_df(event_id, comp)
-            mask = (
-                (changed["player1_goals"] != orig["player1_goals"])
-                | (changed["player2_goals"] != orig["player2_goals"])
-            )
-            changed = changed[mask]
-            if changed.empty:
-                st.warning("no changes to save.")
-            else:
-                try:
-                    with closing(get_db_connection()) as conn, closing(conn.cursor()) as cur:
-                        for _, row in changed.iterrows():
-                            if pd.isna(row["player1_goals"]) or pd.isna(row["player2_goals"]):
-                                continue
-                            cur.execute(
-                                """
-                                update event_matches
-                                   set p1_goals = %s,
-                                       p2_goals = %s,
-                                       status = 'final',
-                                       updated_timestamp = current_timestamp
-                                 where id = %s
-                                """,
-                                (int(row["player1_goals"]), int(row["player2_goals"]), int(row["id"])),
-                            )
-                        conn.commit()
-                    st.success("✅ scores saved; matches now 'final'.")
-                    update_knockout_placeholders(event_id)
-                    st.session_state["match_df"] = None
-                    st.experimental_rerun()
-                except Exception as exc:
-                    st.error(f"❌ DB update failed: {exc}")
-
-        # ---------------------------------------------------------------- simulate
-        if edited_df is not None and st.button("🎲 Simulate Scores"):
+        render_scoring(event_id, comp)
+
+
+def render_scoring(event_id: int, comp: str):
+    # ---------------------------------------------------------------- scoring table
+    edited_df = render_match_table(event_id, comp)
+    for match_id, (p1, p2, now1, now2) in (st.session_state.get(f"match_pending_{event_id}_{comp}") or {}).items():
+        st.warning(
+            f"⚠️ match {match_id} was changed by another desk "
+            f"(now {now1 if now1 is not None else '-'}–{now2 if now2 is not None else '-'}); "
+            f"your {p1}–{p2} was not saved. Save again to overwrite it."
+        )
+
+    if edited_df is not None and st.button("🔄 Reload matches"):
+        reset_match_editor(event_id, comp)
+        st.rerun()
+
+    # ---------------------------------------------------------------- save scores
+    if edited_df is not None and st.button("💾 Save Scores"):
+        scores = edited_scores(event_id, comp, edited_df)
+        if not scores:
+            st.warning("no changes to save.")
+        else:
             try:
                 with closing(get_db_connection()) as conn, closing(conn.cursor()) as cur:
-                    cur.execute(
-                        """
-                        select id from event_matches
-                        where event_id = %s and competition_type = %s and status = 'scheduled'
-                        """,
-                        (event_id, comp),
-                    )
-                    ids = [r[0] for r in cur.fetchall()]
-                    for mid in ids:
-                        p1, p2 = random.randint(0, 5), random.randint(0, 5)
-                        cur.execute(
-                            """
-                            update event_matches
-                               set p1_goals = %s, p2_goals = %s,
-                                   status = 'final',
-                                   updated_timestamp = current_timestamp
-                             where id = %s
-                            """,
-                            (p1, p2, mid),
-                        )
-                    conn.commit()
-                st.success(f"✅ simulated {len(ids)} matches.")
-                update_knockout_placeholders(event_id)
-                st.experimental_rerun()
+                    try:
+                        saved, filled, conflicts = commit_scores(cur, scores)
+                        conn.commit()
+                    except Exception:
+                        conn.rollback()
+                        raise
+                bump_event_version(event_id)
+                st.success(f"✅ {saved} score(s) saved; matches now 'final'.")
+                if filled:
+                    st.success(f"✅ {filled} knockout slot(s) filled.")
+                # reload the editor (saved rows and the other desk's scores
+                # with their new versions) and hold only the refused scores
+                reset_match_editor(event_id, comp)
+                mine = {match_id: (p1, p2) for match_id, p1, p2, _ in scores}
+                if conflicts:
+                    st.session_state[f"match_pending_{event_id}_{comp}"] = {
+                        match_id: (*mine[match_id], now1, now2) for match_id, now1, now2 in conflicts
+                    }
+                st.rerun()
             except Exception as exc:
-                st.error(f"❌ simulation failed: {exc}")
+                st.error(f"❌ DB update failed: {exc}")
+
+    # ---------------------------------------------------------------- simulate
+    if edited_df is not None and st.button("🎲 Simulate Scores"):
+        try:
+            with closing(get_db_connection()) as conn, closing(conn.cursor()) as cur:
+                cur.execute(
+                    """
+                    select id, version from event_matches
+                    where event_id = %s and competition_type = %s and status = 'scheduled'
+                    """,
+                    (event_id, comp),
+                )
+                scores = [
+                    (mid, random.randint(0, 5), random.randint(0, 5), version)
+                    for mid, version in cur.fetchall()
+                ]
+                saved, filled, _ = commit_scores(cur, scores, rated=False)
+                conn.commit()
+            bump_event_version(event_id)
+            st.success(f"✅ simulated {saved} matches; {filled} knockout slot(s) filled.")
+            reset_match_editor(event_id, comp)
+            st.rerun()
+        except Exception as exc:
+            st.error(f"❌ simulation failed: {exc}")
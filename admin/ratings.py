@@ -0,0 +1,231 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+from contextlib import closing
+from utils import get_db_connection
+from admin.bulk_write import apply_bulk_update, insert_many
+from engine.rating import INITIAL_RATING, replay
+
+RATING_COLUMNS = ("player_id", "rating", "matches")
+DELTA_COLUMNS = ("match_id", "player_1_id", "player_2_id", "player_1_delta", "player_2_delta")
+
+# Seeds handed out per competition by "Prefill seeds"
+DEFAULT_SEEDS = 8
+
+UPSERT_RATING_SQL = """
+    insert into player_ratings (player_id, rating, matches)
+    values (%s, %s, %s)
+    on duplicate key update rating = values(rating), matches = values(matches)
+"""
+
+UPSERT_DELTA_SQL = """
+    insert into match_rating_deltas
+        (match_id, player_1_id, player_2_id, player_1_delta, player_2_delta)
+    values (%s, %s, %s, %s, %s)
+    on duplicate key update
+        player_1_id = values(player_1_id), player_2_id = values(player_2_id),
+        player_1_delta = values(player_1_delta), player_2_delta = values(player_2_delta)
+"""
+
+# Every rateable result, oldest first (simulated scores are never rated)
+HISTORY_SQL = """
+    select m.id, m.player_1_id, m.player_2_id, m.p1_goals, m.p2_goals
+    from event_matches m
+    join events e on e.id = m.event_id
+    where m.status = 'final' and not m.simulated
+      and m.player_1_id > 0 and m.player_2_id > 0
+      and m.p1_goals is not null and m.p2_goals is not null
+    order by e.event_start_date, m.event_id, m.round_no, m.id
+"""
+
+# Take a competition's stored rating changes back out of player_ratings
+UNDO_SQL = """
+    update player_ratings r
+    join (
+        select player_id, sum(delta) as delta, count(*) as n
+        from (
+            select d.player_1_id as player_id, d.player_1_delta as delta
+            from match_rating_deltas d join event_matches m on m.id = d.match_id
+            where m.event_id = %s and m.competition_type = %s
+            union all
+            select d.player_2_id, d.player_2_delta
+            from match_rating_deltas d join event_matches m on m.id = d.match_id
+            where m.event_id = %s and m.competition_type = %s
+        ) x
+        group by player_id
+    ) u on u.player_id = r.player_id
+    set r.rating = r.rating - u.delta, r.matches = greatest(r.matches - u.n, 0)
+"""
+
+
+def apply_rating_updates(cur, before, after: dict) -> int:
+    """Rate the just-saved matches on top of the current ratings.
+
+    ``before``/``after`` are as for ``admin.standings.apply_standings_delta``.
+    The players' rating rows are locked; a match rated before (a corrected
+    score) has its old change undone first.  Runs on the caller's cursor and
+    transaction; returns the number of matches rated.
+    """
+    matches = sorted(
+        (mid, p1, p2, *after[mid])
+        for mid, _, _, _, _, p1, p2, *_ in before
+        if mid in after and p1 > 0 and p2 > 0
+    )
+    if not matches:
+        return 0
+    players = sorted({p for _, p1, p2, *_ in matches for p in (p1, p2)})
+    marks = ", ".join(["%s"] * len(players))
+    cur.execute(
+        f"select player_id, rating, matches from player_ratings where player_id in ({marks}) for update",
+        players,
+    )
+    rating = {pid: (float(r), int(n)) for pid, r, n in cur.fetchall()}
+
+    ids = [m[0] for m in matches]
+    cur.execute(
+        f"""
+        select player_1_id, player_2_id, player_1_delta, player_2_delta
+        from match_rating_deltas
+        where match_id in ({", ".join(["%s"] * len(ids))})
+        """,
+        ids,
+    )
+    for p1, p2, d1, d2 in cur.fetchall():
+        for pid, d in ((p1, d1), (p2, d2)):
+            r, n = rating.get(pid, (INITIAL_RATING, 1))
+            rating[pid] = (r - float(d), n - 1)
+
+    _, p1, p2, g1, g2 = zip(*matches)
+    result = replay(p1, p2, g1, g2, initial={pid: r for pid, (r, _) in rating.items()})
+    cur.executemany(UPSERT_RATING_SQL, [
+        (int(pid), float(r), rating.get(int(pid), (0, 0))[1] + int(n))
+        for pid, r, n in zip(result.players, result.rating, result.matches)
+    ])
+    cur.executemany(UPSERT_DELTA_SQL, [
+        (mid, a, b, float(d1), float(d2))
+        for (mid, a, b, _, _), d1, d2 in zip(matches, result.delta1, result.delta2)
+    ])
+    return len(matches)
+
+
+def undo_rating_updates(cur, event_id: int, comp: str) -> int:
+    """Subtract the rating changes of a competition's matches before they are deleted.
+
+    The stored deltas would otherwise vanish with the matches (ON DELETE
+    CASCADE) and leave their effect in player_ratings.  Runs on the caller's
+    cursor and transaction; returns the number of player rows updated.
+    """
+    cur.execute(UNDO_SQL, (event_id, comp, event_id, comp))
+    updated = max(cur.rowcount, 0)
+    cur.execute(
+        """
+        delete d from match_rating_deltas d join event_matches m on m.id = d.match_id
+        where m.event_id = %s and m.competition_type = %s
+        """,
+        (event_id, comp),
+    )
+    return updated
+
+
+def rebuild_ratings() -> dict:
+    """Replay every final result from scratch and replace both tables.
+
+    Returns audit figures comparing the incremental ratings with the replay.
+    """
+    with closing(get_db_connection()) as conn, closing(conn.cursor()) as cur:
+        cur.execute(HISTORY_SQL)
+        history = pd.DataFrame(cur.fetchall(), columns=["id", "p1", "p2", "g1", "g2"])
+        cur.execute("select player_id, rating from player_ratings")
+        current = dict(cur.fetchall())
+
+        result = replay(history["p1"], history["p2"], history["g1"], history["g2"])
+        drift = np.array([
+            abs(float(current[pid]) - r) for pid, r in zip(result.players.tolist(), result.rating)
+            if pid in current
+        ])
+        try:
+            cur.execute("delete from match_rating_deltas")
+            cur.execute("delete from player_ratings")
+            insert_many(cur, "player_ratings", RATING_COLUMNS, zip(
+                result.players.tolist(), result.rating.tolist(), result.matches.tolist(),
+            ))
+            insert_many(cur, "match_rating_deltas", DELTA_COLUMNS, zip(
+                history["id"].tolist(), history["p1"].tolist(), history["p2"].tolist(),
+                result.delta1.tolist(), result.delta2.tolist(),
+            ))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    return {
+        "matches": len(history),
+        "players": len(result.players),
+        "drifted": int((drift > 0.01).sum()),
+        "max_drift": float(drift.max(initial=0.0)),
+    }
+
+
+def fetch_ratings(player_ids) -> dict:
+    """``{player_id: rating}`` for the rated players among ``player_ids``."""
+    player_ids = [int(p) for p in player_ids]
+    if not player_ids:
+        return {}
+    marks = ", ".join(["%s"] * len(player_ids))
+    with closing(get_db_connection()) as conn, closing(conn.cursor()) as cur:
+        cur.execute(f"select player_id, rating from player_ratings where player_id in ({marks})", player_ids)
+        return {pid: float(r) for pid, r in cur.fetchall()}
+
+
+def prefill_seeds(event_id: int, comp: str, seeds_per_comp: int = DEFAULT_SEEDS,
+                  overwrite: bool = False) -> int:
+    """Seed the best-rated registered players of one competition 1..N.
+
+    By default only players without a seed are filled, with the seed numbers
+    not already taken; ``overwrite`` reseeds the whole competition (others 0).
+    """
+    with closing(get_db_connection()) as conn, closing(conn.cursor()) as cur:
+        cur.execute(
+            """
+            select r.id, r.seed_no, pr.rating
+            from event_registration r
+            left join player_ratings pr on pr.player_id = r.user_id
+            where r.event_id = %s and r.competition_type = %s and r.reg_status = 'registered'
+            """,
+            (event_id, comp),
+        )
+        reg = pd.DataFrame(cur.fetchall(), columns=["id", "seed_no", "rating"])
+    if reg.empty:
+        return 0
+    reg["rating"] = pd.to_numeric(reg["rating"])
+    current = pd.to_numeric(reg["seed_no"]).fillna(0).astype(int)
+    free = list(range(1, seeds_per_comp + 1))
+    if overwrite:
+        reg["seed"] = 0
+    else:
+        free = [k for k in free if k not in set(current.tolist())]
+        reg = reg[current <= 0].copy()
+        reg["seed"] = np.nan
+    best = reg[reg["rating"].notna()].sort_values("rating", ascending=False, kind="stable")
+    reg.loc[best.index[:len(free)], "seed"] = free[:len(best)]
+    reg = reg[reg["seed"].notna()]
+    return apply_bulk_update(
+        "event_registration", "id", ("seed_no",),
+        zip(reg["id"].astype(int).tolist(), reg["seed"].astype(int).tolist()),
+        extra_set="t.updated_timestamp = current_timestamp",
+    )
+
+
+def render(event_id: int, expanded: bool = False):
+    with st.expander("📈 Player Ratings", expanded=expanded):
+        st.caption("ratings update as scores are saved; a rebuild replays every final, non-simulated result in date order.")
+        if st.button("📈 Rebuild ratings"):
+            try:
+                audit = rebuild_ratings()
+                st.success(f"✅ rated {audit['matches']} matches for {audit['players']} players.")
+                if audit["drifted"]:
+                    st.warning(
+                        f"⚠️ {audit['drifted']} incremental rating(s) differed from the replay "
+                        f"(max {audit['max_drift']:.1f}); replaced."
+                    )
+            except Exception as exc:
+                st.error(f"❌ rebuild failed: {exc}")
@@ -0,0 +1,140 @@
+import streamlit as st
+import pandas as pd
+from contextlib import closing
+from datetime import datetime, timedelta
+from utils import get_db_connection
+from cache_utils import bump_event_version
+from admin.bulk_write import bulk_insert, rows_from_columns
+from engine.knockout import round_rank
+from engine.pitches import schedule_matches
+
+SCHEDULE_COLUMNS = ("match_id", "event_id", "pitch_no", "slot_no", "scheduled_start")
+
+
+def fetch_schedulable(event_id: int) -> pd.DataFrame:
+    """Matches with both players known, plus any saved slot."""
+    with closing(get_db_connection()) as conn, closing(conn.cursor()) as cur:
+        cur.execute(
+            """
+            select m.id, m.competition_type, m.round_type, m.round_no, m.status,
+                   m.player_1_id, m.player_2_id, v.player1, v.player2,
+                   s.pitch_no, s.slot_no, s.scheduled_start
+            from event_matches m
+            join event_matches_v v on v.id = m.id
+            left join event_match_schedule s on s.match_id = m.id
+            where m.event_id = %s
+              and m.player_1_id > 0 and m.player_2_id > 0
+            order by m.id
+            """,
+            (event_id,),
+        )
+        rows = cur.fetchall()
+        cols = [d[0] for d in cur.description]
+    df = pd.DataFrame(rows, columns=cols)
+    df["slot_no"] = pd.to_numeric(df["slot_no"], errors="coerce")
+    return df
+
+
+def plan(df: pd.DataFrame, n_pitches: int, rest_slots: int, start_slot: int = 0,
+         busy_until=None) -> pd.DataFrame:
+    """Run the scheduler over ``df``; knockout stages go after group rounds."""
+    priority = df["round_type"].map(round_rank).to_numpy() * 1000 + df["round_no"].to_numpy()
+    result = schedule_matches(
+        df["player_1_id"].to_numpy(), df["player_2_id"].to_numpy(),
+        n_pitches=n_pitches, rest_slots=rest_slots, priority=priority,
+        start_slot=start_slot, busy_until=busy_until,
+    )
+    out = df.copy()
+    out["pitch_no"], out["slot_no"] = result.pitch, result.slot
+    st.caption(f"{result.n_slots} slots used (lower bound {result.lower_bound}).")
+    return out
+
+
+def plan_key(event_id: int) -> str:
+    return f"pitch_plan_{event_id}"
+
+
+def save_schedule(event_id: int, planned: pd.DataFrame, first_start: datetime, slot_minutes: int) -> int:
+    """Replace the saved slots of the planned matches; all must belong to ``event_id``."""
+    starts = [first_start + timedelta(minutes=int(s) * slot_minutes) for s in planned["slot_no"]]
+    rows = rows_from_columns(SCHEDULE_COLUMNS, {
+        "match_id": planned["id"].to_numpy(),
+        "event_id": event_id,
+        "pitch_no": planned["pitch_no"].to_numpy(),
+        "slot_no": planned["slot_no"].to_numpy(),
+        "scheduled_start": starts,
+    })
+    ids = [int(i) for i in planned["id"]]
+    with closing(get_db_connection()) as conn:
+        with closing(conn.cursor()) as cur:
+            placeholders = ", ".join(["%s"] * len(ids))
+            cur.execute(
+                f"select count(*) from event_matches where event_id = %s and id in ({placeholders})",
+                [event_id] + ids,
+            )
+            if cur.fetchone()[0] != len(set(ids)):
+                raise ValueError("the plan contains matches of another event; recompute it")
+            cur.execute(f"delete from event_match_schedule where match_id in ({placeholders})", ids)
+        written = bulk_insert(conn, "event_match_schedule", SCHEDULE_COLUMNS, rows)
+    bump_event_version(event_id)
+    return written
+
+
+def render(event_id: int, expanded: bool = False):
+    with st.expander("🗓️ Pitch Scheduling", expanded=expanded):
+        df = fetch_schedulable(event_id)
+        if df.empty:
+            st.info("ℹ️ no matches with known players to schedule.")
+            return
+
+        c1, c2, c3 = st.columns(3)
+        n_pitches = c1.number_input("pitches", min_value=1, max_value=64, value=4, step=1)
+        slot_minutes = c2.number_input("slot length (min)", min_value=5, max_value=180, value=20, step=5)
+        rest_slots = c3.number_input("rest slots between games", min_value=0, max_value=5, value=1, step=1)
+
+        c1, c2 = st.columns(2)
+        day = c1.date_input("first slot date", key="sched_day")
+        time_ = c2.time_input("first slot time", key="sched_time")
+        first_start = datetime.combine(day, time_)
+
+        col_a, col_b = st.columns(2)
+        with col_a:
+            if st.button("📅 Compute full schedule"):
+                st.session_state[plan_key(event_id)] = plan(df, n_pitches, rest_slots)
+        with col_b:
+            # after an overrun: keep what has finished or started, redo the rest
+            if st.button("⏱️ Reschedule remaining from now"):
+                resume = max(0, int((datetime.now() - first_start).total_seconds() // (slot_minutes * 60)) + 1)
+                started = (df["status"] == "final") | (df["slot_no"].notna() & (df["slot_no"] < resume))
+                busy = {}
+                for _, row in df[started & df["slot_no"].notna()].iterrows():
+                    free = int(row["slot_no"]) + rest_slots + 1
+                    for pid in (row["player_1_id"], row["player_2_id"]):
+                        busy[pid] = max(busy.get(pid, 0), free)
+                remaining = df[~started]
+                if remaining.empty:
+                    st.info("ℹ️ nothing left to reschedule.")
+                else:
+                    st.session_state[plan_key(event_id)] = plan(remaining, n_pitches, rest_slots, resume, busy)
+
+        planned = st.session_state.get(plan_key(event_id))
+        if planned is not None and not planned.empty:
+            grid = planned.assign(
+                fixture=planned["player1"] + " v " + planned["player2"],
+                start=[first_start + timedelta(minutes=int(s) * slot_minutes) for s in planned["slot_no"]],
+            ).pivot_table(index=["slot_no", "start"], columns="pitch_no", values="fixture", aggfunc="first")
+            st.dataframe(grid, use_container_width=True)
+
+            if st.button("💾 Save Schedule"):
+                try:
+                    written = save_schedule(event_id, planned, first_start, slot_minutes)
+                    st.session_state[plan_key(event_id)] = None
+                    st.success(f"✅ {written} match slot(s) saved.")
+                except Exception as exc:
+                    st.error(f"❌ failed to save schedule: {exc}")
+        elif df["slot_no"].notna().any():
+            saved = df[df["slot_no"].notna()].sort_values(["slot_no", "pitch_no"])
+            st.dataframe(
+                saved[["scheduled_start", "pitch_no", "competition_type", "round_type", "player1", "player2", "status"]],
+                use_container_width=True, hide_index=True,
+            )
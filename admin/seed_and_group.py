@@ -1,18 +1,22 @@
 import streamlit as st
 import pandas as pd
 from utils import get_db_connection
+from cache_utils import bump_event_version
+from admin.bulk_write import apply_bulk_update
+from admin.ratings import DEFAULT_SEEDS, prefill_seeds
 
-def render(event_id):
-    with st.expander("➕ Seeding and Group Assignment", expanded=False):
+def render(event_id, expanded=False):
+    with st.expander("➕ Seeding and Group Assignment", expanded=expanded):
         try:
             conn = get_db_connection()
             cursor = conn.cursor()
             cursor.execute("""
-                SELECT group_no, seed_no, first_name, last_name, club_code, id, user_id, event_id
+                SELECT competition_type, group_no, seed_no, first_name, last_name, club_code, id, user_id, event_id
                 FROM event_registration_v
                 WHERE event_id = %s
+                  AND id NOT IN (SELECT id FROM event_registration WHERE event_id = %s AND reg_status = 'waitlist')
                 ORDER BY last_name, first_name
-            """, (event_id,))
+            """, (event_id, event_id))
             rows = cursor.fetchall()
             cols = [desc[0] for desc in cursor.description]  # lowercase columns expected
             df = pd.DataFrame(rows, columns=cols)
@@ -27,6 +31,19 @@ def render(event_id):
             st.info("No registrations found for this competition.")
             return
 
+        c1, c2, c3 = st.columns([1, 1, 2])
+        comp = c1.selectbox("Competition", sorted(df["competition_type"].dropna().unique()), key="prefill_seed_comp")
+        seeds = c2.number_input("Seeds", min_value=1, max_value=64, value=DEFAULT_SEEDS)
+        overwrite = c3.checkbox("Overwrite existing seeds", help="otherwise only unseeded players are filled")
+        if c3.button("⭐ Prefill seeds from ratings"):
+            try:
+                updated = prefill_seeds(event_id, comp, int(seeds), overwrite=overwrite)
+                bump_event_version(event_id)
+                st.success(f"✅ {updated} seed(s) changed.")
+                st.rerun()
+            except Exception as e:
+                st.error(f"❌ Failed to prefill seeds: {e}")
+
         # Copy full df for update reference
         df_full = df.copy()
 
@@ -62,46 +79,29 @@ def render(event_id):
             updated_df = edited_df.copy()
             updated_df["id"] = df_full["id"]
 
-            # Find changed rows by comparing with original df
-            changed_mask = (
-                (updated_df["seed_no"] != df_full["seed_no"]) |
-                (updated_df["group_no"] != df_full["group_no"])
-            )
+            # Stage (id, seed_no, group_no) for every changed row
+            seed_no = pd.to_numeric(updated_df["seed_no"], errors="coerce").fillna(0).astype(int)
+            group_no = updated_df["group_no"].where(updated_df["group_no"].notna(), "").astype(str)
+            old_seed = pd.to_numeric(df_full["seed_no"], errors="coerce").fillna(0).astype(int)
+            old_group = df_full["group_no"].where(df_full["group_no"].notna(), "").astype(str)
+            changed_mask = (seed_no != old_seed) | (group_no != old_group)
 
-            changed_rows = updated_df[changed_mask]
+            staged = list(zip(
+                updated_df.loc[changed_mask, "id"].astype(int).tolist(),
+                seed_no[changed_mask].tolist(),
+                group_no[changed_mask].tolist(),
+            ))
 
-            if changed_rows.empty:
+            if not staged:
                 st.warning("No changes detected.")
             else:
                 try:
-                    conn = get_db_connection()
-                    cursor = conn.cursor()
-
-                    for _, row in changed_rows.iterrows():
-                        try:
-                            seed_no = int(row["seed_no"])
-                        except (ValueError, TypeError):
-                            seed_no = 0
-                        group_no = str(row["group_no"]) if row["group_no"] is not None else ''
-                        record_id = row["id"]
-
-                        cursor.execute("""
-                            UPDATE event_registration
-                            SET seed_no = %s,
-                                group_no = %s,
-                                updated_timestamp = CURRENT_TIMESTAMP
-                            WHERE id = %s
-                        """, (
-                            seed_no,
-                            group_no,
-                            record_id
-                        ))
-
-                    conn.commit()
-                    st.success(f"✅ {len(changed_rows)} record(s) updated.")
+                    updated = apply_bulk_update(
+                        "event_registration", "id", ("seed_no", "group_no"), staged,
+                        extra_set="t.updated_timestamp = current_timestamp",
+                    )
+                    bump_event_version(event_id)
+                    st.success(f"✅ {updated} of {len(staged)} record(s) updated.")
                     st.rerun()
                 except Exception as e:
                     st.error(f"❌ Failed to update records: {e}")
-                finally:
-                    cursor.close()
-                    conn.close()
@@ -0,0 +1,250 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+from collections import defaultdict
+from contextlib import closing
+from utils import get_db_connection
+from cache_utils import bump_event_version
+from admin.bulk_write import bulk_update
+from engine.standings import DEFAULT_ORDER, compute_standings
+
+STAT_COLUMNS = ("played", "won", "drawn", "lost", "gf", "ga", "gd", "pts")
+
+# Tiebreak order within a group (see engine.standings.TIEBREAK_KEYS)
+TIEBREAK_ORDER = DEFAULT_ORDER
+
+DELTA_SQL = f"""
+    insert into event_standings
+        (event_id, competition_type, group_no, player_id, player, {", ".join(STAT_COLUMNS)})
+    values (%s, %s, %s, %s, %s, {", ".join(["%s"] * len(STAT_COLUMNS))})
+    on duplicate key update
+        {", ".join(f"{c} = {c} + values({c})" for c in STAT_COLUMNS)}
+"""
+
+# One row per player per group match, both sides, from scratch
+REBUILD_SQL = """
+    insert into event_standings
+        (event_id, competition_type, group_no, player_id, player,
+         played, won, drawn, lost, gf, ga, gd, pts)
+    select event_id, competition_type, group_no, player_id, max(player),
+           sum(done), sum(done and gf > ga), sum(done and gf = ga), sum(done and gf < ga),
+           sum(if(done, gf, 0)), sum(if(done, ga, 0)), sum(if(done, gf - ga, 0)),
+           sum(if(done, 3 * (gf > ga) + (gf = ga), 0))
+    from (
+        select m.event_id, m.competition_type, m.group_no, m.player_1_id as player_id,
+               v.player1 as player, m.p1_goals as gf, m.p2_goals as ga,
+               m.status = 'final' as done
+        from event_matches m join event_matches_v v on v.id = m.id
+        where m.event_id = %s and m.round_type = 'group' and m.player_1_id > 0 {scope}
+        union all
+        select m.event_id, m.competition_type, m.group_no, m.player_2_id,
+               v.player2, m.p2_goals, m.p1_goals,
+               m.status = 'final'
+        from event_matches m join event_matches_v v on v.id = m.id
+        where m.event_id = %s and m.round_type = 'group' and m.player_2_id > 0 {scope}
+    ) x
+    group by event_id, competition_type, group_no, player_id
+"""
+
+
+def _result(gf, ga) -> tuple:
+    """One side's contribution to STAT_COLUMNS for a final score."""
+    won, drawn, lost = int(gf > ga), int(gf == ga), int(gf < ga)
+    return (1, won, drawn, lost, gf, ga, gf - ga, 3 * won + drawn)
+
+
+def rerank(cur, event_id: int, groups=None) -> int:
+    """Recompute rank_no for ``groups`` ((competition_type, group_no) pairs) or the whole event.
+
+    Ranks come from the group matches via ``engine.standings``, so head-to-head
+    tiebreaks apply.  Returns the number of rows updated.
+    """
+    groups = sorted(set(groups or ()))
+    scope, params = "", [event_id]
+    if groups:
+        scope = "and (competition_type, group_no) in (" + ", ".join(["(%s, %s)"] * len(groups)) + ")"
+        params += [v for g in groups for v in g]
+    cur.execute(
+        f"""
+        select competition_type, group_no, player_1_id, player_2_id, p1_goals, p2_goals, status
+        from event_matches
+        where event_id = %s and round_type = 'group'
+          and player_1_id > 0 and player_2_id > 0 {scope}
+        """,
+        params,
+    )
+    m = pd.DataFrame(
+        cur.fetchall(),
+        columns=["competition_type", "group_no", "p1", "p2", "g1", "g2", "status"],
+    )
+    if m.empty:
+        return 0
+
+    n = len(m)
+    comp = np.concatenate([m["competition_type"].to_numpy()] * 2)
+    group_no = np.concatenate([m["group_no"].to_numpy()] * 2)
+    player = np.concatenate([m["p1"].to_numpy(), m["p2"].to_numpy()])
+    codes, players = pd.factorize(pd.Series(list(zip(comp, group_no, player))))
+    final = m["status"].eq("final").to_numpy()
+    g1 = np.where(final, pd.to_numeric(m["g1"]).to_numpy(dtype=float, na_value=np.nan), np.nan)
+    g2 = np.where(final, pd.to_numeric(m["g2"]).to_numpy(dtype=float, na_value=np.nan), np.nan)
+
+    table = compute_standings(
+        [f"{c}|{g}" for c, g, _ in players], codes[:n], codes[n:], g1, g2,
+        order=TIEBREAK_ORDER,
+    )
+    return bulk_update(
+        cur, "event_standings", "player_id", ("rank_no",),
+        [(int(p), int(r), event_id, c, g) for (c, g, p), r in zip(players, table.rank)],
+        match_columns=("event_id", "competition_type", "group_no"),
+    )
+
+
+def apply_standings_delta(cur, before, after: dict) -> int:
+    """Move the standings by the difference between old and new match results.
+
+    ``before`` rows are ``(id, event_id, competition_type, group_no, round_type,
+    player_1_id, player_2_id, status, p1_goals, p2_goals)`` as locked before the
+    write; ``after`` maps match id to the new ``(p1_goals, p2_goals)``.  A
+    previously final score is subtracted and the new one added, so re-editing
+    a result is safe.  A competition with no standings rows yet (e.g. one
+    running since before event_standings existed) is rebuilt from the
+    already-written matches instead.  Runs on the caller's cursor and
+    transaction; returns the number of player rows touched.
+    """
+    rebuilt = 0
+    for event_id, comp in sorted({(r[1], r[2]) for r in before if r[0] in after}):
+        cur.execute(
+            "select 1 from event_standings where event_id = %s and competition_type = %s limit 1",
+            (event_id, comp),
+        )
+        if cur.fetchone() is None:
+            rebuilt += rebuild_standings(cur, event_id, comp)
+            before = [r for r in before if (r[1], r[2]) != (event_id, comp)]
+
+    delta = defaultdict(lambda: [0] * len(STAT_COLUMNS))
+    names_needed = set()
+    for mid, event_id, comp, group_no, round_type, p1, p2, status, g1, g2 in before:
+        if mid not in after or str(round_type).lower() != "group" or not (p1 > 0 and p2 > 0):
+            continue
+        n1, n2 = after[mid]
+        changes = [(+1, n1, n2)]
+        if status == "final" and g1 is not None and g2 is not None:
+            changes.append((-1, g1, g2))
+        for sign, a, b in changes:
+            for player, gf, ga in ((p1, a, b), (p2, b, a)):
+                acc = delta[(event_id, comp, group_no, player)]
+                for k, v in enumerate(_result(gf, ga)):
+                    acc[k] += sign * v
+        names_needed.add(mid)
+
+    if not delta:
+        return rebuilt
+
+    placeholders = ", ".join(["%s"] * len(names_needed))
+    cur.execute(
+        f"""
+        select m.player_1_id, v.player1, m.player_2_id, v.player2
+        from event_matches m join event_matches_v v on v.id = m.id
+        where m.id in ({placeholders})
+        """,
+        list(names_needed),
+    )
+    names = {}
+    for p1, n1, p2, n2 in cur.fetchall():
+        names[p1], names[p2] = n1, n2
+
+    cur.executemany(DELTA_SQL, [
+        (*key, names.get(key[3], ""), *stats) for key, stats in delta.items()
+    ])
+    by_event = defaultdict(set)
+    for event_id, comp, group_no, _ in delta:
+        by_event[event_id].add((comp, group_no))
+    for event_id, groups in by_event.items():
+        rerank(cur, event_id, groups)
+    return rebuilt + len(delta)
+
+
+def rebuild_standings(cur, event_id: int, comp: str | None = None) -> int:
+    """Recompute an event's (or one competition's) standings from event_matches.
+
+    Players with group fixtures but no final result get zero rows.  Runs on
+    the caller's cursor and transaction; returns the number of rows written.
+    """
+    scope, params = "", [event_id]
+    if comp is not None:
+        scope, params = "and competition_type = %s", [event_id, comp]
+    cur.execute(f"delete from event_standings where event_id = %s {scope}", params)
+
+    m_scope = "and m.competition_type = %s" if comp is not None else ""
+    cur.execute(REBUILD_SQL.format(scope=m_scope), params + params)
+    written = max(cur.rowcount, 0)
+    rerank(cur, event_id, None if comp is None else _groups(cur, event_id, comp))
+    return written
+
+
+def _groups(cur, event_id: int, comp: str) -> list:
+    cur.execute(
+        "select distinct competition_type, group_no from event_standings "
+        "where event_id = %s and competition_type = %s",
+        (event_id, comp),
+    )
+    return cur.fetchall()
+
+
+def compare_with_view(cur, event_id: int) -> pd.DataFrame:
+    """Rows where event_standings and event_table_v disagree (empty when they match)."""
+    keys = ["competition_type", "group_no", "player"]
+    stats = ["rank"] + list(STAT_COLUMNS)
+
+    cur.execute(
+        f"""
+        select competition_type, group_no, player, `rank`, {", ".join(STAT_COLUMNS)}
+        from event_table_v
+        where event_id = %s and round_type = 'Group'
+        """,
+        (event_id,),
+    )
+    view = pd.DataFrame(cur.fetchall(), columns=keys + stats)
+    cur.execute(
+        f"""
+        select competition_type, group_no, player, rank_no, {", ".join(STAT_COLUMNS)}
+        from event_standings
+        where event_id = %s
+        """,
+        (event_id,),
+    )
+    table = pd.DataFrame(cur.fetchall(), columns=keys + stats)
+
+    for df in (view, table):
+        df["group_no"] = df["group_no"].astype(str)
+        df[stats] = df[stats].apply(pd.to_numeric, errors="coerce")
+    both = view.merge(table, on=keys, how="outer", suffixes=("_view", "_table"), indicator=True)
+    differs = both["_merge"] != "both"
+    for c in stats:
+        differs |= both[f"{c}_view"].ne(both[f"{c}_table"])
+    return both[differs].drop(columns="_merge")
+
+
+def render(event_id: int, expanded: bool = False):
+    with st.expander("🧮 Standings", expanded=expanded):
+        st.caption("standings are updated as scores are saved; rebuild recomputes them from the matches.")
+        if st.button("🧮 Rebuild standings"):
+            try:
+                with closing(get_db_connection()) as conn, closing(conn.cursor()) as cur:
+                    try:
+                        written = rebuild_standings(cur, event_id)
+                        conn.commit()
+                    except Exception:
+                        conn.rollback()
+                        raise
+                    diff = compare_with_view(cur, event_id)
+                bump_event_version(event_id)
+                st.success(f"✅ rebuilt {written} standings row(s).")
+                if diff.empty:
+                    st.success("✅ matches event_table_v.")
+                else:
+                    st.warning(f"⚠️ {len(diff)} row(s) differ from event_table_v.")
+                    st.dataframe(diff, use_container_width=True, hide_index=True)
+            except Exception as exc:
+                st.error(f"❌ rebuild failed: {exc}")
@@ -0,0 +1,168 @@
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing
+
+import pandas as pd
+import streamlit as st
+
+from utils import get_db_connection
+from engine.knockout import BracketTemplates
+
+# Max number of cached (event, view) frames kept per server process
+EVENT_CACHE_MAX_ENTRIES = 256
+
+# How often (seconds) to check knockout_matches for changes
+KO_TEMPLATE_CHECK_SECONDS = 300
+
+
+class EventCache:
+    """Process-wide LRU of query results keyed by (event_id, view).
+
+    Every event carries a version number; writers call ``bump`` and all
+    entries cached under an older version are dropped immediately.  Loads
+    are single-flight per key, so a burst of spectators on a cold key runs
+    the query once.
+    """
+
+    def __init__(self, max_entries: int = EVENT_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()     # (event_id, view) -> (version, value)
+        self._versions = {}               # event_id -> int
+        self._loading = {}                # (event_id, view) -> Lock
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------ versions
+    def version(self, event_id) -> int:
+        with self._lock:
+            return self._versions.get(event_id, 0)
+
+    def bump(self, event_id) -> int:
+        """Invalidate everything cached for ``event_id``; return the new version."""
+        with self._lock:
+            version = self._versions.get(event_id, 0) + 1
+            self._versions[event_id] = version
+            for key in [k for k in self._entries if k[0] == event_id]:
+                del self._entries[key]
+            return version
+
+    # ------------------------------------------------------------------ lookups
+    def _lookup(self, key):
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == self._versions.get(key[0], 0):
+            self._entries.move_to_end(key)
+            return entry
+        return None
+
+    def get_or_load(self, event_id, view: str, loader):
+        key = (event_id, view)
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is not None:
+                self.hits += 1
+                return entry[1]
+            key_lock = self._loading.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                # another session may have loaded it while we waited
+                entry = self._lookup(key)
+                if entry is not None:
+                    self.hits += 1
+                    return entry[1]
+                self.misses += 1
+                version = self._versions.get(event_id, 0)
+
+            try:
+                value = loader()
+                with self._lock:
+                    # a write during the load means the value may already be stale
+                    if version == self._versions.get(event_id, 0):
+                        self._entries[key] = (version, value)
+                        self._entries.move_to_end(key)
+                        while len(self._entries) > self.max_entries:
+                            self._entries.popitem(last=False)
+                            self.evictions += 1
+            finally:
+                # also when the loader raises: waiters then retry the load
+                with self._lock:
+                    self._loading.pop(key, None)
+            return value
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+@st.cache_resource(show_spinner=False)
+def get_event_cache() -> EventCache:
+    return EventCache()
+
+
+def bump_event_version(event_id) -> int:
+    """Call after any write that changes what an event's views return."""
+    return get_event_cache().bump(event_id)
+
+
+def event_version(event_id) -> int:
+    return get_event_cache().version(event_id)
+
+
+def cached_event_query(event_id, view: str, sql: str, params=()) -> pd.DataFrame:
+    """Run ``sql`` through the shared event cache and return a private copy."""
+    def load():
+        with closing(get_db_connection()) as conn, closing(conn.cursor()) as cur:
+            cur.execute(sql, params)
+            rows = cur.fetchall()
+            cols = [d[0] for d in cur.description]
+        return pd.DataFrame(rows, columns=cols)
+
+    # callers are free to mutate what they get back
+    return get_event_cache().get_or_load(event_id, view, load).copy()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Knockout bracket templates, loaded once per process
+
+@st.cache_resource(show_spinner=False)
+def _bracket_template_holder() -> dict:
+    return {"templates": None, "checked_at": 0.0, "lock": threading.Lock()}
+
+
+def get_bracket_templates(force: bool = False) -> BracketTemplates:
+    """Shared ``knockout_matches`` templates.
+
+    At most every KO_TEMPLATE_CHECK_SECONDS the table checksum is compared
+    with the one the templates were built from; rows are only re-read when
+    it differs (or with ``force=True``).
+    """
+    holder = _bracket_template_holder()
+    with holder["lock"]:
+        templates = holder["templates"]
+        if not force and templates is not None and time.monotonic() - holder["checked_at"] < KO_TEMPLATE_CHECK_SECONDS:
+            return templates
+
+        with closing(get_db_connection()) as conn, closing(conn.cursor()) as cur:
+            cur.execute("checksum table knockout_matches")
+            fingerprint = cur.fetchone()[1]
+            if force or templates is None or templates.fingerprint != fingerprint:
+                cur.execute("""
+                    select id, round_type, group_no, p1_id, p2_id, min_group, max_group
+                    from knockout_matches
+                """)
+                templates = BracketTemplates.from_rows(cur.fetchall(), fingerprint)
+
+        holder["templates"] = templates
+        holder["checked_at"] = time.monotonic()
+        return templates
@@ -0,0 +1,140 @@
+"""Group draw: snake seeding plus swap-based local search, vectorized with NumPy."""
+import string
+from dataclasses import dataclass
+
+import numpy as np
+
+# Objective weights: one same-club pair outweighs any strength imbalance
+CLUB_WEIGHT = 1e6
+BALANCE_WEIGHT = 1.0
+
+
+@dataclass(frozen=True)
+class DrawMetrics:
+    club_clashes: int          # same-club pairs sharing a group
+    strength_spread: float     # max - min of group mean strength
+    strength_std: float        # std of group mean strength
+    size_range: int            # largest - smallest group
+
+
+@dataclass(frozen=True)
+class Draw:
+    """``group[p]`` is player ``p``'s group index (0-based), input order."""
+    group: np.ndarray
+    metrics: DrawMetrics
+    swaps: int
+
+
+def group_labels(n: int) -> list:
+    """A, B, ... Z, AA, AB, ... for ``n`` groups."""
+    letters = string.ascii_uppercase
+    return [letters[i] if i < 26 else letters[i // 26 - 1] + letters[i % 26] for i in range(n)]
+
+
+def _clashes(group, club, n_groups):
+    known = club >= 0
+    counts = np.zeros((n_groups, int(club.max(initial=-1)) + 1), dtype=np.int64)
+    np.add.at(counts, (group[known], club[known]), 1)
+    return counts
+
+
+def draw_metrics(group, strength, club=None) -> DrawMetrics:
+    group = np.asarray(group)
+    strength = np.asarray(strength, dtype=np.float64)
+    n_groups = int(group.max()) + 1 if len(group) else 0
+    sizes = np.bincount(group, minlength=n_groups)
+    means = np.bincount(group, weights=strength, minlength=n_groups) / np.maximum(sizes, 1)
+    clashes = 0
+    if club is not None and len(group):
+        _, codes = np.unique(np.asarray(club, dtype=object).astype(str), return_inverse=True)
+        codes = np.where(_known(club), codes.ravel(), -1)
+        counts = _clashes(group, codes, n_groups)
+        clashes = int((counts * (counts - 1) // 2).sum())
+    return DrawMetrics(
+        club_clashes=clashes,
+        strength_spread=float(means.max() - means.min()) if n_groups else 0.0,
+        strength_std=float(means.std()) if n_groups else 0.0,
+        size_range=int(sizes.max() - sizes.min()) if n_groups else 0,
+    )
+
+
+def _known(club):
+    return np.array([c is not None and c == c for c in club], dtype=bool)
+
+
+def draw_groups(strength, n_groups: int, club=None, rng=None, max_swaps: int = 2000) -> Draw:
+    """Split players into ``n_groups`` groups.
+
+    Players are ordered by ``strength`` (higher is stronger; ties are broken
+    at random by ``rng``) and snaked into pots of ``n_groups``, one player per
+    group per pot, so seeds stay apart and sizes differ by at most one.
+    Local search then swaps two players of the same pot between groups,
+    best swap first, while it lowers same-club pairs (first) or the spread of
+    group strength totals.
+    """
+    rng = np.random.default_rng(rng)
+    strength = np.asarray(strength, dtype=np.float64)
+    n = len(strength)
+    if n == 0:
+        return Draw(np.empty(0, dtype=np.int64), draw_metrics(np.empty(0, dtype=np.int64), strength), 0)
+
+    if club is None:
+        codes = np.full(n, -1)
+    else:
+        _, codes = np.unique(np.asarray(club, dtype=object).astype(str), return_inverse=True)
+        codes = np.where(_known(club), codes.ravel(), -1)
+
+    # snake: pot k fills groups left-to-right for even k, right-to-left for odd k
+    order = np.lexsort((rng.random(n), -strength))
+    rank = np.empty(n, dtype=np.int64)
+    rank[order] = np.arange(n)
+    pot, slot = np.divmod(rank, n_groups)
+    group = np.where(pot % 2 == 0, slot, n_groups - 1 - slot)
+
+    counts = _clashes(group, codes, n_groups)
+    totals = np.bincount(group, weights=strength, minlength=n_groups)
+
+    # candidate swaps only pair players of the same pot: a (pots, G, G) block
+    members = np.full((int(pot.max()) + 1, n_groups), -1)
+    members[pot, slot] = np.arange(n)
+    valid = members >= 0
+    m = np.maximum(members, 0)
+    allowed = valid[:, :, None] & valid[:, None, :] & np.triu(np.ones((n_groups, n_groups), dtype=bool), 1)
+    c = codes[m]
+    ci, cj = c[:, :, None], c[:, None, :]
+    same_club = (ci == cj) & (ci >= 0)
+    sm = strength[m]
+    d = sm[:, None, :] - sm[:, :, None]                    # change of i's group total
+
+    def count(g, club):
+        return np.where(club >= 0, counts[g, np.maximum(club, 0)], 0) if counts.size else 0
+
+    swaps = 0
+    while swaps < max_swaps:
+        g = group[m]
+        gi, gj = g[:, :, None], g[:, None, :]
+        # same-club pairs gained minus lost when i and j trade groups
+        d_club = (
+            np.where(ci >= 0, count(gj, ci) - same_club - count(gi, ci) + 1, 0)
+            + np.where(cj >= 0, count(gi, cj) - same_club - count(gj, cj) + 1, 0)
+        )
+        d_bal = 2 * d * (totals[gi] - totals[gj]) + 2 * d * d
+        gain = np.where(allowed, -(CLUB_WEIGHT * d_club + BALANCE_WEIGHT * d_bal), -np.inf)
+
+        p, a, b = np.unravel_index(int(np.argmax(gain)), gain.shape)
+        if gain[p, a, b] <= 1e-9:
+            break
+        i, j = members[p, a], members[p, b]
+        ga, gb = group[i], group[j]
+        if codes[i] >= 0:
+            counts[ga, codes[i]] -= 1
+            counts[gb, codes[i]] += 1
+        if codes[j] >= 0:
+            counts[gb, codes[j]] -= 1
+            counts[ga, codes[j]] += 1
+        totals[ga] += strength[j] - strength[i]
+        totals[gb] += strength[i] - strength[j]
+        group[i], group[j] = gb, ga
+        swaps += 1
+
+    return Draw(group, draw_metrics(group, strength, club), swaps)
@@ -0,0 +1,51 @@
+"""Knockout round ordering and bracket templates (no database access)."""
+from dataclasses import dataclass, field
+
+# Canonical stage order, spelled exactly as the DB labels them
+ROUND_ORDER = (
+    "Group",
+    "Barrage",
+    "Round of 64",
+    "Round of 32",
+    "Round of 16",
+    "Quarter-final",
+    "Semi-final",
+    "Final",
+)
+
+_HYPHENS = str.maketrans({"‐": "-", "‑": "-", "‒": "-", "–": "-"})
+_RANK = {r.lower(): i for i, r in enumerate(ROUND_ORDER)}
+
+
+def round_key(label) -> str:
+    """Normalise a round label: case-insensitive, any Unicode hyphen as '-'."""
+    return str(label or "").translate(_HYPHENS).strip().lower()
+
+
+def round_rank(label) -> int:
+    """Position of ``label`` in ROUND_ORDER; unknown labels sort last."""
+    return _RANK.get(round_key(label), len(ROUND_ORDER))
+
+
+@dataclass(frozen=True)
+class BracketTemplates:
+    """``knockout_matches`` rows pre-sorted and indexed by group count.
+
+    Each template is a tuple of ``(round_type, group_no, p1_id, p2_id)``
+    ordered by stage, then by template id.
+    """
+    by_groups: dict = field(default_factory=dict)
+    fingerprint: object = None
+
+    @classmethod
+    def from_rows(cls, rows, fingerprint=None):
+        """Build from ``(id, round_type, group_no, p1_id, p2_id, min_group, max_group)`` rows."""
+        ordered = sorted(rows, key=lambda r: (round_rank(r[1]), r[0]))
+        by_groups = {}
+        for _id, round_type, group_no, p1_id, p2_id, lo, hi in ordered:
+            for n in range(int(lo), int(hi) + 1):
+                by_groups.setdefault(n, []).append((round_type, group_no, p1_id, p2_id))
+        return cls({n: tuple(t) for n, t in by_groups.items()}, fingerprint)
+
+    def for_groups(self, num_groups: int) -> tuple:
+        return self.by_groups.get(int(num_groups), ())
@@ -0,0 +1,82 @@
+"""Pitch and time-slot assignment for fixtures (greedy list scheduling)."""
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class PitchSchedule:
+    """``pitch`` (1-based) and ``slot`` (0-based) per input match, input order.
+
+    ``lower_bound`` is the fewest slots any schedule could use, so
+    ``n_slots - lower_bound`` shows how close the greedy result is.
+    """
+    pitch: np.ndarray
+    slot: np.ndarray
+    n_slots: int
+    lower_bound: int
+
+
+def schedule_matches(player1, player2, n_pitches: int, rest_slots: int = 0,
+                     priority=None, start_slot: int = 0,
+                     busy_until=None) -> PitchSchedule:
+    """Assign every match a pitch and slot, aiming for the shortest event.
+
+    At each slot the free matches (both players rested) are taken in order of
+    ``priority`` (e.g. round number, lower first), then by how many games
+    their players still have left, until the pitches are full.  Players need
+    ``rest_slots`` empty slots between games.  ``busy_until`` maps player id
+    to the first slot they are free again (used when rescheduling the rest of
+    a running event from ``start_slot``).
+    """
+    p1 = np.asarray(player1)
+    p2 = np.asarray(player2)
+    n = len(p1)
+    if n == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return PitchSchedule(empty, empty, 0, 0)
+
+    ids, codes = np.unique(np.concatenate([p1, p2]), return_inverse=True)
+    a, b = codes[:n], codes[n:]
+    priority = np.zeros(n) if priority is None else np.asarray(priority, dtype=float)
+
+    remaining = np.bincount(codes, minlength=len(ids))
+    free_at = np.full(len(ids), start_slot, dtype=np.int64)
+    for pid, t in (busy_until or {}).items():
+        k = np.searchsorted(ids, pid)
+        if k < len(ids) and ids[k] == pid:
+            free_at[k] = max(free_at[k], int(t))
+
+    gap = rest_slots + 1
+    lower_bound = max(-(-n // n_pitches), int(remaining.max() - 1) * gap + 1)
+
+    pitch = np.zeros(n, dtype=np.int64)
+    slot = np.full(n, -1, dtype=np.int64)
+    open_ = np.ones(n, dtype=bool)
+    t = start_slot
+    while open_.any():
+        cand = np.flatnonzero(open_ & (free_at[a] <= t) & (free_at[b] <= t))
+        if len(cand) == 0:
+            pending = np.flatnonzero(open_)
+            t = int(np.maximum(free_at[a[pending]], free_at[b[pending]]).min())
+            continue
+
+        load = remaining[a[cand]] + remaining[b[cand]]
+        cand = cand[np.lexsort((-load, priority[cand]))]
+        used = set()
+        placed = 0
+        for m in cand:
+            if a[m] in used or b[m] in used:
+                continue
+            used.update((a[m], b[m]))
+            placed += 1
+            pitch[m], slot[m] = placed, t
+            open_[m] = False
+            remaining[a[m]] -= 1
+            remaining[b[m]] -= 1
+            free_at[a[m]] = free_at[b[m]] = t + gap
+            if placed == n_pitches:
+                break
+        t += 1
+
+    return PitchSchedule(pitch, slot, int(slot.max()) + 1 - start_slot, lower_bound)
@@ -0,0 +1,74 @@
+"""Elo-style player ratings from match results."""
+from dataclasses import dataclass
+
+import numpy as np
+
+INITIAL_RATING = 1500.0
+K_FACTOR = 32.0
+
+
+@dataclass(frozen=True)
+class RatingReplay:
+    """Final ratings per player id plus the change each match applied."""
+    players: np.ndarray
+    rating: np.ndarray
+    matches: np.ndarray        # games rated per player
+    delta1: np.ndarray         # per input match
+    delta2: np.ndarray
+
+
+def expected(r1, r2):
+    """Player 1's expected score against player 2."""
+    return 1.0 / (1.0 + 10.0 ** ((np.asarray(r2) - np.asarray(r1)) / 400.0))
+
+
+def match_delta(r1, r2, g1, g2, k: float = K_FACTOR):
+    """Rating change for player 1 (player 2 gets the negative).
+
+    Score is 1 / 0.5 / 0; the K factor grows with the goal margin
+    (``1 + ln(1 + margin)``) so a 5-0 moves ratings more than 1-0.
+    Works on scalars or arrays.
+    """
+    g1, g2 = np.asarray(g1, dtype=np.float64), np.asarray(g2, dtype=np.float64)
+    score = np.where(g1 > g2, 1.0, np.where(g1 == g2, 0.5, 0.0))
+    margin = 1.0 + np.log1p(np.abs(g1 - g2))
+    return k * margin * (score - expected(r1, r2))
+
+
+def replay(player1, player2, goals1, goals2, initial=None, k: float = K_FACTOR) -> RatingReplay:
+    """Rate matches in the order given (oldest first).
+
+    ``initial`` maps player id to a starting rating (default INITIAL_RATING).
+    Each match depends on the ratings left by earlier ones, so this is a
+    single pass over compact integer-coded arrays.
+    """
+    p1 = np.asarray(player1)
+    p2 = np.asarray(player2)
+    n = len(p1)
+    players, codes = np.unique(np.concatenate([p1, p2]), return_inverse=True)
+    a, b = codes[:n], codes[n:]
+
+    rating = np.full(len(players), INITIAL_RATING)
+    for pid, r in (initial or {}).items():
+        i = np.searchsorted(players, pid)
+        if i < len(players) and players[i] == pid:
+            rating[i] = r
+    played = np.zeros(len(players), dtype=np.int64)
+
+    # score and margin factor do not depend on ratings: vectorize them
+    g1 = np.asarray(goals1, dtype=np.float64)
+    g2 = np.asarray(goals2, dtype=np.float64)
+    score = np.where(g1 > g2, 1.0, np.where(g1 == g2, 0.5, 0.0)).tolist()
+    step = (k * (1.0 + np.log1p(np.abs(g1 - g2)))).tolist()
+
+    r = rating.tolist()
+    delta = [0.0] * n
+    for m, (i, j) in enumerate(zip(a.tolist(), b.tolist())):
+        d = step[m] * (score[m] - 1.0 / (1.0 + 10.0 ** ((r[j] - r[i]) / 400.0)))
+        r[i] += d
+        r[j] -= d
+        delta[m] = d
+    np.add.at(played, a, 1)
+    np.add.at(played, b, 1)
+    delta = np.array(delta)
+    return RatingReplay(players, np.array(r), played, delta, -delta)
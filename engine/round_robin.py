@@ -0,0 +1,104 @@
+"""Round-robin fixture generation (circle method), vectorized with NumPy.
+
+No Streamlit or database imports, so it can be used from scripts and tests.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class Fixtures:
+    """Columnar fixture list, one entry per match, sorted by group, round.
+
+    ``home`` / ``away`` are positions into the player arrays passed to
+    ``round_robin``; ``group`` indexes into ``labels``.
+    """
+    labels: np.ndarray
+    group: np.ndarray
+    round_no: np.ndarray
+    leg: np.ndarray
+    home: np.ndarray
+    away: np.ndarray
+
+    def __len__(self):
+        return len(self.home)
+
+    @property
+    def rounds(self) -> int:
+        return int(self.round_no.max()) if len(self) else 0
+
+
+def circle_table(n: int):
+    """Slot pairings for an even ``n``: two (n-1, n/2) arrays of home/away slots.
+
+    Slot 0 is fixed and the rest rotate right by one each round, which is the
+    same order the original list rotation produced.  The fixed slot alternates
+    home/away by round and the others by board, keeping each player's home
+    count within one of every other player's.
+    """
+    rounds, half = n - 1, n // 2
+    r = np.arange(rounds)[:, None]
+    k = np.arange(n - 1)[None, :]
+    arrangement = np.concatenate(
+        [np.zeros((rounds, 1), dtype=np.int64), 1 + (k - r) % (n - 1)], axis=1
+    )
+    board = np.arange(half)
+    a = arrangement[:, board]
+    b = arrangement[:, n - 1 - board]
+    swap = np.where(board[None, :] == 0, r % 2 == 1, board[None, :] % 2 == 1)
+    return np.where(swap, b, a), np.where(swap, a, b)
+
+
+def round_robin(group_of, legs: int = 1, keep_byes: bool = False) -> Fixtures:
+    """Build every group's fixtures at once.
+
+    ``group_of`` holds one group label per player; within a group players keep
+    their input order (sort by registration id first for stable draws).
+    Groups of the same size are scheduled together with one fancy-index.
+    Odd groups get a bye slot; bye fixtures are dropped unless ``keep_byes``,
+    in which case the missing side is ``-1``.  ``legs=2`` appends the return
+    fixtures with home and away swapped.
+    """
+    group_of = np.asarray(group_of)
+    labels, inverse = np.unique(group_of, return_inverse=True)
+    inverse = inverse.ravel()
+    order = np.argsort(inverse, kind="stable")
+    sizes = np.bincount(inverse, minlength=len(labels))
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+
+    parts = []
+    for n in np.unique(sizes):
+        if n < 2:
+            continue
+        gids = np.flatnonzero(sizes == n)
+        members = order[starts[gids][:, None] + np.arange(n)]          # (G, n)
+        m = n + n % 2
+        if m > n:
+            # the bye takes the fixed slot, which keeps home counts exactly even
+            members = np.hstack([np.full((len(gids), 1), -1), members])
+        home_slot, away_slot = circle_table(m)                          # (R, H)
+        home = members[:, home_slot]                                    # (G, R, H)
+        away = members[:, away_slot]
+        rounds = m - 1
+        rnd = np.broadcast_to(np.arange(1, rounds + 1)[None, :, None], home.shape)
+        grp = np.broadcast_to(gids[:, None, None], home.shape)
+
+        for leg in range(1, legs + 1):
+            h, a = (home, away) if leg % 2 else (away, home)
+            parts.append((
+                grp.ravel(), (rnd + (leg - 1) * rounds).ravel(),
+                np.full(h.size, leg), h.ravel(), a.ravel(),
+            ))
+
+    if not parts:
+        empty = np.empty(0, dtype=np.int64)
+        return Fixtures(labels, empty, empty, empty, empty, empty)
+
+    grp, rnd, leg, home, away = (np.concatenate(c) for c in zip(*parts))
+    if not keep_byes:
+        played = (home >= 0) & (away >= 0)
+        grp, rnd, leg, home, away = (c[played] for c in (grp, rnd, leg, home, away))
+
+    idx = np.lexsort((rnd, grp))
+    return Fixtures(labels, grp[idx], rnd[idx], leg[idx], home[idx], away[idx])
@@ -0,0 +1,110 @@
+"""Group tables and tiebreaks from a columnar match list, vectorized with NumPy."""
+from dataclasses import dataclass
+
+import numpy as np
+
+# Tiebreak keys, all "higher is better".  h2h_* are the same stats counted
+# only over matches between the players still level on the keys before them.
+TIEBREAK_KEYS = ("pts", "gd", "gf", "won", "h2h_pts", "h2h_gd", "h2h_gf")
+DEFAULT_ORDER = ("pts", "gd", "gf", "h2h_pts", "h2h_gd", "h2h_gf")
+
+
+@dataclass(frozen=True)
+class Standings:
+    """Per-player table columns, in input player order.
+
+    ``rank`` is 1-based within the group; players level on every tiebreak
+    share a rank (like SQL ``rank()``).  ``order`` lists player positions by
+    group, then rank.
+    """
+    group: np.ndarray
+    played: np.ndarray
+    won: np.ndarray
+    drawn: np.ndarray
+    lost: np.ndarray
+    gf: np.ndarray
+    ga: np.ndarray
+    gd: np.ndarray
+    pts: np.ndarray
+    rank: np.ndarray
+    order: np.ndarray
+
+
+def _table(n, home, away, hg, ag, points):
+    """played/won/drawn/lost/gf/ga/pts per player from finished matches only."""
+    win, draw, loss = points
+    stats = {}
+    hw, dr, aw = hg > ag, hg == ag, hg < ag
+    for name, h, a in (
+        ("played", np.ones_like(hg), np.ones_like(ag)),
+        ("won", hw, aw), ("drawn", dr, dr), ("lost", aw, hw),
+        ("gf", hg, ag), ("ga", ag, hg),
+        ("pts", win * hw + draw * dr + loss * aw, win * aw + draw * dr + loss * hw),
+    ):
+        stats[name] = (
+            np.bincount(home, weights=h, minlength=n)
+            + np.bincount(away, weights=a, minlength=n)
+        ).astype(np.int64)
+    stats["gd"] = stats["gf"] - stats["ga"]
+    return stats
+
+
+def _clusters(group, keys):
+    """Id per player shared by group-mates level on all ``keys``."""
+    if not keys:
+        return group
+    _, ids = np.unique(np.column_stack([group] + keys), axis=0, return_inverse=True)
+    return ids.ravel()
+
+
+def compute_standings(group_of, home, away, home_goals, away_goals,
+                      order=DEFAULT_ORDER, points=(3, 1, 0)) -> Standings:
+    """Rank every group at once.
+
+    ``group_of`` gives each player's group (any labels); ``home``/``away``
+    are player positions per match and ``home_goals``/``away_goals`` hold
+    NaN for unplayed matches.  ``order`` is a sequence of TIEBREAK_KEYS
+    applied left to right.  The head-to-head mini-league is computed once,
+    among players level on every key before the first ``h2h_*`` key.
+    """
+    unknown = set(order) - set(TIEBREAK_KEYS)
+    if unknown:
+        raise ValueError(f"unknown tiebreak keys: {sorted(unknown)}")
+
+    _, group = np.unique(np.asarray(group_of), return_inverse=True)
+    group = group.ravel()
+    n = len(group)
+    home = np.asarray(home, dtype=np.int64)
+    away = np.asarray(away, dtype=np.int64)
+    hg = np.asarray(home_goals, dtype=np.float64)
+    ag = np.asarray(away_goals, dtype=np.float64)
+
+    played = ~(np.isnan(hg) | np.isnan(ag))
+    home, away, hg, ag = home[played], away[played], hg[played], ag[played]
+    stats = _table(n, home, away, hg, ag, points)
+
+    keys = {k: stats[k] for k in ("pts", "gd", "gf", "won")}
+    h2h_at = next((i for i, k in enumerate(order) if k.startswith("h2h_")), None)
+    if h2h_at is not None:
+        cluster = _clusters(group, [keys[k] for k in order[:h2h_at]])
+        inside = cluster[home] == cluster[away]
+        mini = _table(n, home[inside], away[inside], hg[inside], ag[inside], points)
+        keys.update({f"h2h_{k}": mini[k] for k in ("pts", "gd", "gf")})
+
+    # lexsort: last key is primary; negate for "higher is better"
+    columns = [-keys[k] for k in reversed(order)] + [group]
+    sort = np.lexsort([np.arange(n)] + columns)
+
+    # rank: 1 + position of the first player level on every key
+    level = np.column_stack([group] + [keys[k] for k in order])[sort]
+    new_block = np.ones(n, dtype=bool)
+    new_block[1:] = (level[1:] != level[:-1]).any(axis=1)
+    new_group = np.ones(n, dtype=bool)
+    new_group[1:] = group[sort][1:] != group[sort][:-1]
+    pos = np.arange(n)
+    group_start = np.maximum.accumulate(np.where(new_group, pos, 0))
+    block_start = np.maximum.accumulate(np.where(new_block, pos, 0))
+    rank = np.empty(n, dtype=np.int64)
+    rank[sort] = block_start - group_start + 1
+
+    return Standings(group=group, rank=rank, order=sort, **stats)
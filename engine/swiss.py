@@ -0,0 +1,115 @@
+"""Swiss-system round pairing: greedy score-group pairing plus 2-opt repair."""
+from dataclasses import dataclass
+
+import numpy as np
+
+# Pairing costs, in strictly decreasing priority
+REMATCH_COST = 1e6
+CLUB_COST = 1e3
+SCORE_GAP_COST = 10.0
+RANK_GAP_COST = 0.01
+
+
+@dataclass(frozen=True)
+class SwissRound:
+    """One round's pairings as positions into the inputs; ``bye`` is -1 if none."""
+    home: np.ndarray
+    away: np.ndarray
+    bye: int
+    rematches: int
+    club_clashes: int
+
+
+def _played_matrix(n, played_pairs):
+    played = np.zeros((n, n), dtype=bool)
+    pairs = np.asarray(list(played_pairs), dtype=np.int64).reshape(-1, 2)
+    played[pairs[:, 0], pairs[:, 1]] = True
+    played[pairs[:, 1], pairs[:, 0]] = True
+    return played
+
+
+def pair_round(score, club=None, played_pairs=(), had_bye=None, home_count=None,
+               max_passes: int = 500) -> SwissRound:
+    """Pair the next round.
+
+    Players are ranked by ``score`` (ties keep input order, so pass them in
+    seed order).  Pair costs penalise, in order: rematches, same-club
+    pairings, score-group gaps and rank distance.  A greedy pass pairs each
+    player with the cheapest lower-ranked opponent, then 2-opt swaps between
+    pairs are applied while they lower the total cost.  With an odd field the
+    lowest-ranked player without a previous bye sits out.  The player with
+    fewer home games so far is home.
+    """
+    score = np.asarray(score, dtype=np.float64)
+    n = len(score)
+    had_bye = np.zeros(n, dtype=bool) if had_bye is None else np.asarray(had_bye, dtype=bool)
+    home_count = np.zeros(n) if home_count is None else np.asarray(home_count, dtype=np.float64)
+    order = np.lexsort((np.arange(n), -score))
+
+    bye = -1
+    if n % 2:
+        candidates = [p for p in order[::-1] if not had_bye[p]]
+        bye = int(candidates[0] if candidates else order[-1])
+        order = order[order != bye]
+
+    m = len(order)
+    if m == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return SwissRound(empty, empty, bye, 0, 0)
+
+    played = _played_matrix(n, played_pairs)[np.ix_(order, order)]
+    rank = np.arange(m, dtype=np.float64)
+    cost = (
+        REMATCH_COST * played
+        + SCORE_GAP_COST * np.abs(score[order][:, None] - score[order][None, :])
+        + RANK_GAP_COST * np.abs(rank[:, None] - rank[None, :])
+    )
+    same = np.zeros((m, m), dtype=bool)
+    if club is not None:
+        c = np.asarray(club, dtype=object)[order]
+        known = np.array([x is not None and x == x for x in c])
+        same = (c[:, None] == c[None, :]) & known[:, None] & known[None, :]
+        cost += CLUB_COST * same
+    np.fill_diagonal(cost, np.inf)
+
+    # greedy: best remaining opponent for each player, top of the table first
+    free = np.ones(m, dtype=bool)
+    a, b = [], []
+    for i in range(m):
+        if not free[i]:
+            continue
+        free[i] = False
+        row = np.where(free, cost[i], np.inf)
+        j = int(np.argmin(row))
+        free[j] = False
+        a.append(i)
+        b.append(j)
+    a, b = np.array(a), np.array(b)
+
+    # 2-opt: swap partners between two pairs while it lowers the total cost
+    for _ in range(max_passes):
+        cur = cost[a, b]
+        base = cur[:, None] + cur[None, :]
+        swap1 = cost[a[:, None], a[None, :]] + cost[b[:, None], b[None, :]]
+        swap2 = cost[a[:, None], b[None, :]] + cost[b[:, None], a[None, :]]
+        gain1, gain2 = base - swap1, base - swap2
+        np.fill_diagonal(gain1, 0)
+        np.fill_diagonal(gain2, 0)
+        k1, k2 = np.unravel_index(np.argmax(gain1), gain1.shape), np.unravel_index(np.argmax(gain2), gain2.shape)
+        best1, best2 = gain1[k1], gain2[k2]
+        if max(best1, best2) <= 1e-9:
+            break
+        p, q = k1 if best1 >= best2 else k2
+        if best1 >= best2:
+            a[p], b[p], a[q], b[q] = a[p], a[q], b[p], b[q]
+        else:
+            a[p], b[p], a[q], b[q] = a[p], b[q], b[p], a[q]
+
+    rematches = int(played[a, b].sum())
+    club_clashes = int(same[a, b].sum())
+
+    pa, pb = order[a], order[b]
+    swap = home_count[pb] < home_count[pa]
+    home = np.where(swap, pb, pa)
+    away = np.where(swap, pa, pb)
+    return SwissRound(home, away, bye, rematches, club_clashes)
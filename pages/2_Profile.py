@@ -1,6 +1,6 @@
 import streamlit as st
 import datetime
-from utils import get_db_connection
+from utils import get_db_connection, invalidate_identity
 from sidebar_utils import render_sidebar_widgets
 
 today = datetime.date.today()
@@ -123,6 +123,7 @@ def show():
                                 current_email
                             ))
                             conn.commit()
+                            invalidate_identity(current_email)
                             st.success("✅ Profile updated successfully. Please refresh the page.")
                         except Exception as e:
                             st.error(f"❌ Failed to update profile: {e}")
@@ -7,6 +7,7 @@ from utils import (
     get_db_connection,
     ensure_profile_complete,
     get_admin_club_ids,
+    get_userid,
 )
 
 def fetch_one(cursor, query, params=()):
@@ -22,16 +23,13 @@ def show():
     st.title("🏟️ My Clubs")
     ensure_profile_complete()
 
+    # -------------------------------------------------- current player
+    user_id = get_userid()
+    if not user_id:
+        st.error("❌ Could not find player ID.")
+        return
+
     with closing(get_db_connection()) as conn, closing(conn.cursor()) as cursor:
-        # -------------------------------------------------- current player
-        player = fetch_one(cursor,
-            "SELECT id FROM registrations WHERE email = %s",
-            (st.user.email,)
-        )
-        if not player:
-            st.error("❌ Could not find player ID.")
-            return
-        user_id = player[0]
 
         # -------------------------------------------------- club view
         rows, cols = fetch_all(
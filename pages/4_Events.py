@@ -1,129 +1,233 @@
 import streamlit as st
 import pandas as pd
+from contextlib import closing
 from utils import get_db_connection
 from tabs import Details, Register, Tables, Scores, Result, Admin
+from tabs.bundle import load_event_bundle
 from admin import new_event
-from utils import get_admin_club_ids
+from utils import get_admin_club_ids, get_userid
 
 st.set_page_config(page_title="Events", layout="wide")
-st.title("📅 Events")
 
-try:
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT *, CONCAT(CASE WHEN event_open    THEN 'Open, '    ELSE '' END, CASE WHEN event_women   THEN 'Women, '   ELSE '' END, CASE WHEN event_junior  THEN 'Junior, '  ELSE '' END, CASE WHEN event_veteran THEN 'Veteran, ' ELSE '' END, CASE WHEN event_teams   THEN 'Teams, '   ELSE '' END) AS competitions FROM events ORDER BY event_start_date DESC")
-    rows = cursor.fetchall()
-    cols = [desc[0] for desc in cursor.description]
-    df = pd.DataFrame(rows, columns=cols)
-except Exception as e:
-    st.error(f"Error loading events: {e}")
-    df = pd.DataFrame()
-finally:
-    cursor.close()
-    conn.close()
+EVENTS_PAGE_SIZE = 50
+HIDDEN_STATUSES = ("Pending", "Cancelled")   # not shown to non-admins
+
+EVENT_COLUMNS = """
+    *, CONCAT(CASE WHEN event_open    THEN 'Open, '    ELSE '' END,
+              CASE WHEN event_women   THEN 'Women, '   ELSE '' END,
+              CASE WHEN event_junior  THEN 'Junior, '  ELSE '' END,
+              CASE WHEN event_veteran THEN 'Veteran, ' ELSE '' END,
+              CASE WHEN event_teams   THEN 'Teams, '   ELSE '' END) AS competitions
+"""
+
+# sections that read the event bundle; Details and Admin do not
+BUNDLE_TABS = ("REGISTER", "TABLES", "SCORES", "RESULT")
+
+def fetch_all_df(sql, params=()):
+    with closing(get_db_connection()) as conn, closing(conn.cursor()) as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+        cols = [desc[0] for desc in cursor.description]
+        return pd.DataFrame(rows, columns=cols)
+
+def visibility_clause(is_admin):
+    """SQL fragment and params hiding Pending/Cancelled events from non-admins."""
+    if is_admin:
+        return "1 = 1", ()
+    return "event_status NOT IN (%s, %s)", HIDDEN_STATUSES
+
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_filter_options(is_admin):
+    where, params = visibility_clause(is_admin)
+    df = fetch_all_df(f"""
+        SELECT DISTINCT event_type, event_status FROM events WHERE {where}
+    """, params)
+    return (
+        sorted(df["event_type"].dropna().unique()),
+        sorted(df["event_status"].dropna().unique()),
+    )
+
+def fetch_events_page(is_admin, title, event_type, status, after=None):
+    """One page of events, newest first, starting after the (date, id) cursor."""
+    where, params = visibility_clause(is_admin)
+    clauses, params = [where], list(params)
+    if title:
+        clauses.append("event_title LIKE %s")
+        params.append(f"%{title}%")
+    if event_type != "All":
+        clauses.append("event_type = %s")
+        params.append(event_type)
+    if status != "All":
+        clauses.append("event_status = %s")
+        params.append(status)
+    if after:
+        clauses.append("(event_start_date < %s OR (event_start_date = %s AND id < %s))")
+        params += [after[0], after[0], after[1]]
+
+    # one extra row tells us whether an older page exists
+    df = fetch_all_df(f"""
+        SELECT {EVENT_COLUMNS}
+        FROM events
+        WHERE {" AND ".join(clauses)}
+        ORDER BY event_start_date DESC, id DESC
+        LIMIT %s
+    """, (*params, EVENTS_PAGE_SIZE + 1))
+    return df.head(EVENTS_PAGE_SIZE), len(df) > EVENTS_PAGE_SIZE
+
+def fetch_event(event_id, is_admin):
+    where, params = visibility_clause(is_admin)
+    df = fetch_all_df(f"""
+        SELECT {EVENT_COLUMNS} FROM events WHERE id = %s AND {where}
+    """, (event_id, *params))
+    return None if df.empty else df.iloc[0].to_dict()
+
+def back_to_list():
+    st.session_state.pop("selected_event_id", None)
+    st.session_state.pop("event_tab", None)
+    st.session_state.pop("admin_section", None)
+    for key in ("event", "tab", "section"):
+        st.query_params.pop(key, None)
+
+st.title("📅 Events")
 
 admin_club_ids = get_admin_club_ids()
 is_admin = bool(admin_club_ids)
 
-if df.empty:
-    st.info("No events found.")
-    new_event.add_new_event()
-
-else:
-    if "selected_event_id" not in st.session_state:
-        st.session_state.selected_event_id = None
-
-    selected_event_id = st.session_state.selected_event_id
-
-    if not selected_event_id:
-        # Filters
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            title_filter = st.text_input("Search by Title")
-        with col2:
-            type_filter = st.selectbox("Event Type", ["All"] + sorted(df["event_type"].dropna().unique()))
-        # Determine status options
-        if admin_club_ids:
-            # Admin user – show all statuses
-            status_options = sorted(df["event_status"].dropna().unique())
-        else:
-            # Not admin – exclude 'Pending' and 'Cancelled'
-            status_options = sorted(df[~df["event_status"].isin(["Pending", "Cancelled"])]["event_status"].dropna().unique())
+if "selected_event_id" not in st.session_state:
+    # deep link: ?event=<id>&tab=<section>
+    event_param = st.query_params.get("event")
+    st.session_state.selected_event_id = (
+        int(event_param) if event_param and event_param.isdigit() else None
+    )
+
+selected_event_id = st.session_state.selected_event_id
+
+if not selected_event_id:
+    try:
+        type_options, status_options = fetch_filter_options(is_admin)
+    except Exception as e:
+        st.error(f"Error loading events: {e}")
+        type_options, status_options = [], []
+
+    # Filters
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        title_filter = st.text_input("Search by Title")
+    with col2:
+        type_filter = st.selectbox("Event Type", ["All"] + type_options)
+    with col3:
+        status_filter = st.selectbox("Event Status", ["All"] + status_options)
+
+    # keyset pagination: a stack of (event_start_date, id) cursors, reset
+    # whenever the filters change
+    filters = (title_filter, type_filter, status_filter, is_admin)
+    if st.session_state.get("event_page_filters") != filters:
+        st.session_state.event_page_filters = filters
+        st.session_state.event_page_cursors = [None]
+    cursors = st.session_state.event_page_cursors
+
+    try:
+        df_page, has_more = fetch_events_page(is_admin, title_filter, type_filter, status_filter, cursors[-1])
+    except Exception as e:
+        st.error(f"Error loading events: {e}")
+        df_page, has_more = pd.DataFrame(), False
+
+    if df_page.empty:
+        st.info("No events found.")
+    else:
+        display_cols = [
+            "id", "event_title", "event_type", "event_start_date", "event_end_date",
+            "event_location", "event_status"
+        ]
+        df_display = df_page[display_cols].copy()
+        df_display["event_start_date"] = pd.to_datetime(df_display["event_start_date"]).dt.strftime('%Y-%m-%d')
+        df_display["event_end_date"] = pd.to_datetime(df_display["event_end_date"]).dt.strftime('%Y-%m-%d')
         
-        with col3:
-            status_filter = st.selectbox("Event Status", ["All"] + status_options)
-                        
-            df_filtered = df.copy()
-            
-            # For non-admins, exclude Pending and Cancelled events
-            if not is_admin:
-                df_filtered = df_filtered[~df_filtered["event_status"].isin(["Pending", "Cancelled"])]
-
-        if title_filter:
-            df_filtered = df_filtered[df_filtered["event_title"].str.contains(title_filter, case=False, na=False)]
-        if type_filter != "All":
-            df_filtered = df_filtered[df_filtered["event_type"] == type_filter]
-        if status_filter != "All":
-            df_filtered = df_filtered[df_filtered["event_status"] == status_filter]
-
-        if df_filtered.empty:
-            st.info("No events found.")
-        else:
-            display_cols = [
-                "id", "event_title", "event_type", "event_start_date", "event_end_date",
-                "event_location", "event_status"
-            ]
-            df_display = df_filtered[display_cols].copy()
-            df_display["event_start_date"] = pd.to_datetime(df_display["event_start_date"]).dt.strftime('%Y-%m-%d')
-            df_display["event_end_date"] = pd.to_datetime(df_display["event_end_date"]).dt.strftime('%Y-%m-%d')
-            
-            selection = st.dataframe(
-                df_display,
-                selection_mode="single-row",
-                on_select="rerun",
-                hide_index=True,
-                use_container_width=True,
-                key="event_table"
-            )
-
-            selection_data = st.session_state.get("event_table")
-
-            if (
-                selection_data
-                and "selection" in selection_data
-                and selection_data["selection"].get("rows")
-                and st.session_state.get("selected_event_id") is None
-            ):
-                row_index = selection_data["selection"]["rows"][0]
-                selected_id = df_display.iloc[row_index]["id"]
-                st.session_state.selected_event_id = selected_id
+        selection = st.dataframe(
+            df_display,
+            selection_mode="single-row",
+            on_select="rerun",
+            hide_index=True,
+            use_container_width=True,
+            key=f"event_table_{len(cursors)}"
+        )
+
+        selection_data = st.session_state.get(f"event_table_{len(cursors)}")
+
+        if (
+            selection_data
+            and "selection" in selection_data
+            and selection_data["selection"].get("rows")
+            and st.session_state.get("selected_event_id") is None
+        ):
+            row_index = selection_data["selection"]["rows"][0]
+            selected_id = int(df_display.iloc[row_index]["id"])
+            st.session_state.selected_event_id = selected_id
+            st.rerun()
+
+        nav1, nav2, _ = st.columns([1, 1, 6])
+        with nav1:
+            if len(cursors) > 1 and st.button("◀ Newer"):
+                cursors.pop()
+                st.rerun()
+        with nav2:
+            if has_more and st.button("Older ▶"):
+                last = df_page.iloc[-1]
+                cursors.append((last["event_start_date"], int(last["id"])))
                 st.rerun()
 
-            new_event.add_new_event()
+    new_event.add_new_event()
 
-    else:
-        st.button("🔙 Back to Event List", on_click=lambda: st.session_state.pop("selected_event_id"))
-
-        selected_event = df[df["id"] == selected_event_id].iloc[0].to_dict()
-        test_mode = st.session_state.get("test_mode", False)
-        with st.spinner("Loading event details..."):
-            pages_info = [
-                ("DETAILS",  Details),
-                ("REGISTER", Register),
+else:
+    st.button("🔙 Back to Event List", on_click=back_to_list)
+
+    try:
+        selected_event = fetch_event(selected_event_id, is_admin)
+    except Exception as e:
+        st.error(f"Error loading event: {e}")
+        st.stop()
+    if selected_event is None:
+        st.info("Event not found.")
+        st.stop()
+    st.query_params["event"] = str(selected_event_id)
+    test_mode = st.session_state.get("test_mode", False)
+    with st.spinner("Loading event details..."):
+        pages_info = [
+            ("DETAILS",  Details),
+            ("REGISTER", Register),
+        ]
+        if test_mode:
+            pages_info += [
+                ("TABLES", Tables),
+                ("SCORES", Scores),
+                ("RESULT", Result),
             ]
-            if test_mode:
-                pages_info += [
-                    ("TABLES", Tables),
-                    ("SCORES", Scores),
-                    ("RESULT", Result),
-                ]
-            if is_admin:
-                pages_info.append(("ADMIN", Admin))
-            tabs = st.tabs([label for label, _ in pages_info])
-        
-            for tab, (_, page_module) in zip(tabs, pages_info):
-                with tab:
-                    page_module.page(selected_event)
+        if is_admin:
+            pages_info.append(("ADMIN", Admin))
+
+        # Only the selected section runs; the choice lives in session
+        # state and the ?tab= query param so links reopen the same view.
+        labels = [label for label, _ in pages_info]
+        if st.session_state.get("event_tab") not in labels:
+            tab_param = str(st.query_params.get("tab", "")).upper()
+            st.session_state.event_tab = tab_param if tab_param in labels else labels[0]
+
+        current = st.radio(
+            "Section", labels, key="event_tab",
+            horizontal=True, label_visibility="collapsed",
+        )
+        st.query_params["tab"] = current.lower()
+        page_module = dict(pages_info)[current]
+
+        bundle = None
+        if current in BUNDLE_TABS:
+            try:
+                bundle = load_event_bundle(selected_event, get_userid())
+            except Exception as e:
+                st.error(f"❌ Failed to load event details: {e}")
+                st.stop()
+
+        page_module.page(selected_event, bundle)
 
 
 if st.session_state.get("test_mode"):
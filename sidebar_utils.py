@@ -68,6 +68,11 @@ def render_sidebar_widgets():
                 )
                 st.session_state["testing_checklist"][key] = checked
                 
+    # Shared event cache counters
+    with st.sidebar.expander("📦 Event Cache"):
+        from cache_utils import get_event_cache
+        st.json(get_event_cache().stats())
+
     # Bug Report
     with st.sidebar.expander("🐞 Report a Bug"):
         with st.form("bug_report_form"):
@@ -0,0 +1,5 @@
+-- Events list: keyset pagination on (event_start_date, id) and the common
+-- status / type filters (pages/4_Events.py).
+CREATE INDEX events_start_id_ix ON events (event_start_date, id);
+CREATE INDEX events_status_start_ix ON events (event_status, event_start_date, id);
+CREATE INDEX events_type_start_ix ON events (event_type, event_start_date, id);
@@ -0,0 +1,3 @@
+-- Group-completion checks in knockout advancement (admin/generate_matches.py).
+CREATE INDEX event_matches_group_status_ix
+    ON event_matches (event_id, competition_type, round_type, group_no, status);
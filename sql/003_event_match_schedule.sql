@@ -0,0 +1,12 @@
+-- Pitch / time-slot assignments for event_matches (admin/schedule_pitches.py).
+CREATE TABLE event_match_schedule (
+    match_id          INT          NOT NULL PRIMARY KEY,
+    event_id          INT          NOT NULL,
+    pitch_no          INT          NOT NULL,
+    slot_no           INT          NOT NULL,
+    scheduled_start   DATETIME     NOT NULL,
+    updated_timestamp TIMESTAMP    NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    KEY event_match_schedule_slot_ix (event_id, slot_no, pitch_no),
+    CONSTRAINT event_match_schedule_match_fk
+        FOREIGN KEY (match_id) REFERENCES event_matches (id) ON DELETE CASCADE
+);
@@ -0,0 +1,3 @@
+-- Per-match row version for optimistic concurrency between scoring desks
+-- (admin/generate_matches.commit_scores).
+ALTER TABLE event_matches ADD COLUMN version INT NOT NULL DEFAULT 0;
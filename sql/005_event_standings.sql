@@ -0,0 +1,52 @@
+-- Group standings kept up to date by the score-commit path instead of being
+-- aggregated by event_table_v on every read (admin/standings.py).
+CREATE TABLE event_standings (
+    event_id          INT          NOT NULL,
+    competition_type  VARCHAR(50)  NOT NULL,
+    group_no          VARCHAR(20)  NOT NULL,
+    player_id         INT          NOT NULL,
+    player            VARCHAR(255) NOT NULL,
+    rank_no           INT          NOT NULL DEFAULT 0,
+    played            INT          NOT NULL DEFAULT 0,
+    won               INT          NOT NULL DEFAULT 0,
+    drawn             INT          NOT NULL DEFAULT 0,
+    lost              INT          NOT NULL DEFAULT 0,
+    gf                INT          NOT NULL DEFAULT 0,
+    ga                INT          NOT NULL DEFAULT 0,
+    gd                INT          NOT NULL DEFAULT 0,
+    pts               INT          NOT NULL DEFAULT 0,
+    updated_timestamp TIMESTAMP    NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (event_id, competition_type, group_no, player_id)
+);
+
+-- backfill events already in progress from their group matches
+INSERT INTO event_standings
+    (event_id, competition_type, group_no, player_id, player,
+     played, won, drawn, lost, gf, ga, gd, pts)
+SELECT event_id, competition_type, group_no, player_id, MAX(player),
+       SUM(done), SUM(done AND gf > ga), SUM(done AND gf = ga), SUM(done AND gf < ga),
+       SUM(IF(done, gf, 0)), SUM(IF(done, ga, 0)), SUM(IF(done, gf - ga, 0)),
+       SUM(IF(done, 3 * (gf > ga) + (gf = ga), 0))
+FROM (
+    SELECT m.event_id, m.competition_type, m.group_no, m.player_1_id AS player_id,
+           v.player1 AS player, m.p1_goals AS gf, m.p2_goals AS ga, m.status = 'final' AS done
+    FROM event_matches m JOIN event_matches_v v ON v.id = m.id
+    WHERE m.round_type = 'group' AND m.player_1_id > 0
+    UNION ALL
+    SELECT m.event_id, m.competition_type, m.group_no, m.player_2_id,
+           v.player2, m.p2_goals, m.p1_goals, m.status = 'final'
+    FROM event_matches m JOIN event_matches_v v ON v.id = m.id
+    WHERE m.round_type = 'group' AND m.player_2_id > 0
+) x
+GROUP BY event_id, competition_type, group_no, player_id;
+
+-- initial ranks by points, goal difference, goals for; the app re-ranks a
+-- group with head-to-head tiebreaks as soon as one of its scores is saved
+UPDATE event_standings s
+JOIN (
+    SELECT event_id, competition_type, group_no, player_id,
+           RANK() OVER (PARTITION BY event_id, competition_type, group_no
+                        ORDER BY pts DESC, gd DESC, gf DESC) AS r
+    FROM event_standings
+) x USING (event_id, competition_type, group_no, player_id)
+SET s.rank_no = x.r;
@@ -0,0 +1,3 @@
+-- Live refresh probes (tabs/live.py): count / max(updated_timestamp) per event
+-- and the rows changed since, both from the index.
+CREATE INDEX event_matches_updated_ix ON event_matches (event_id, updated_timestamp);
@@ -0,0 +1,23 @@
+-- Race-free registration (tabs/Register.py): one row per player per
+-- competition, enforced by the database, plus per-competition capacity with
+-- a waitlist (admin/capacity.py).
+
+-- keep the earliest row of any existing duplicates
+DELETE r1 FROM event_registration r1
+JOIN event_registration r2
+  ON r1.event_id = r2.event_id
+ AND r1.competition_type = r2.competition_type
+ AND r1.user_id = r2.user_id
+ AND r1.id > r2.id;
+
+ALTER TABLE event_registration
+    ADD COLUMN reg_status VARCHAR(20) NOT NULL DEFAULT 'registered',
+    ADD CONSTRAINT event_registration_player_uq UNIQUE (event_id, competition_type, user_id);
+
+CREATE TABLE event_competition_capacity (
+    event_id          INT          NOT NULL,
+    competition_type  VARCHAR(50)  NOT NULL,
+    capacity          INT          NOT NULL,
+    updated_timestamp TIMESTAMP    NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (event_id, competition_type)
+);
@@ -0,0 +1,18 @@
+-- Elo-style player ratings (admin/ratings.py): current rating per player and
+-- the change each rated match applied, so a corrected score can be undone.
+CREATE TABLE player_ratings (
+    player_id         INT          NOT NULL PRIMARY KEY,
+    rating            DOUBLE       NOT NULL,
+    matches           INT          NOT NULL DEFAULT 0,
+    updated_timestamp TIMESTAMP    NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);
+
+CREATE TABLE match_rating_deltas (
+    match_id          INT          NOT NULL PRIMARY KEY,
+    player_1_id       INT          NOT NULL,
+    player_2_id       INT          NOT NULL,
+    player_1_delta    DOUBLE       NOT NULL,
+    player_2_delta    DOUBLE       NOT NULL,
+    CONSTRAINT match_rating_deltas_match_fk
+        FOREIGN KEY (match_id) REFERENCES event_matches (id) ON DELETE CASCADE
+);
@@ -0,0 +1,3 @@
+-- Scores entered by "Simulate Scores" (admin/generate_matches.py) are not
+-- rated; the flag lets the ratings rebuild (admin/ratings.py) skip them too.
+ALTER TABLE event_matches ADD COLUMN simulated TINYINT(1) NOT NULL DEFAULT 0;
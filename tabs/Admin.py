@@ -1,7 +1,18 @@
 import streamlit as st
-from admin import event_status, seed_and_group, auto_group, generate_matches
+from admin import event_status, seed_and_group, auto_group, generate_matches, schedule_pitches, standings, capacity, ratings
 
-def page(selected_event):
+# Heavy admin sections, rendered only once someone opens them
+SECTIONS = {
+    "Capacity": lambda event_id, user_email: capacity.render(event_id, expanded=True),
+    "Seeding": lambda event_id, user_email: seed_and_group.render(event_id, expanded=True),
+    "Auto Grouping": lambda event_id, user_email: auto_group.render(event_id, user_email, expanded=True),
+    "Matches": lambda event_id, user_email: generate_matches.render_match_generation(event_id, expanded=True),
+    "Pitches": lambda event_id, user_email: schedule_pitches.render(event_id, expanded=True),
+    "Standings": lambda event_id, user_email: standings.render(event_id, expanded=True),
+    "Ratings": lambda event_id, user_email: ratings.render(event_id, expanded=True),
+}
+
+def page(selected_event, bundle=None):
     st.subheader("Event Admin")
 
     # Extract key info
@@ -9,8 +20,21 @@ def page(selected_event):
     event_status_value = selected_event.get("event_status")
     user_email = selected_event.get("update_by", "admin@xabuteo.com")
 
-    # Run sections
+    # Status buttons are cheap, always show them
     event_status.render(event_id, event_status_value, user_email)
-    seed_and_group.render(event_id)
-    auto_group.render(event_id, user_email)
-    generate_matches.render_match_generation(event_id)
+
+    if st.session_state.get("admin_section") not in SECTIONS:
+        section_param = st.query_params.get("section")
+        if section_param in SECTIONS:
+            st.session_state.admin_section = section_param
+
+    section = st.radio(
+        "Admin section", list(SECTIONS),
+        index=None, key="admin_section", horizontal=True,
+    )
+    if section is None:
+        st.query_params.pop("section", None)
+        return
+
+    st.query_params["section"] = section
+    SECTIONS[section](event_id, user_email)
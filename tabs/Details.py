@@ -2,7 +2,7 @@ import streamlit as st
 import pandas as pd
 
 # in detail.py
-def page(selected_event):
+def page(selected_event, bundle=None):
     with st.container(border=True):
         # Header and subheader
         st.subheader(selected_event.get("event_title", "Untitled Event"))
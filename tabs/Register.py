@@ -1,9 +1,19 @@
 import streamlit as st
 import pandas as pd
 from utils import get_db_connection, get_userid
+from cache_utils import bump_event_version
 from datetime import datetime, date, timedelta
+from tabs.registration import age_at, competition_eligibility, register_entries
+from tabs.club_entries import render_club_entries
+from tabs.exports import registrations_csv, registrations_zip
 
-def page(selected_event):
+def register_competitions(user_id, event_id, club_id, comps) -> dict:
+    """Register one player for ``comps``; ``{competition: 'registered' | 'waitlist' | 'already'}``."""
+    comps = sorted(set(comps))
+    result = register_entries(event_id, [(user_id, club_id, comp) for comp in comps], user_id)
+    return dict(zip(comps, result))
+
+def page(selected_event, bundle):
     today = date.today() 
     temp_status = selected_event.get("event_status", "")
     event_id = selected_event.get("id")
@@ -25,54 +35,23 @@ def page(selected_event):
         st.markdown(f"**Registration Dates:** {reg_open} to {reg_close}")
 
         if event_status == "Open":
-            # Competition flags from event setup
-            event_open = selected_event.get("event_open", False)
-            event_women = selected_event.get("event_women", False)
-            event_junior = selected_event.get("event_junior", False)
-            event_veteran = selected_event.get("event_veteran", False)
-            event_teams = selected_event.get("event_teams", False)
-
             event_start_date = pd.to_datetime(selected_event.get("event_start_date")).date()
 
-            # Fetch player info
-            try:
-                conn = get_db_connection()
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT first_name, last_name, date_of_birth, gender, club_id, club_name
-                    FROM player_club_v
-                    WHERE id = %s
-                      AND player_status in ('Active', 'Approved')
-                      AND %s BETWEEN valid_from AND valid_to
-                    LIMIT 1
-                """, (user_id, event_start_date))
-                player = cursor.fetchone()
-            except Exception as e:
-                st.error(f"Error loading club info: {e}")
-                return
-            finally:
-                cursor.close()
-                conn.close()
-
+            # Player info comes with the event bundle
+            player = bundle.player
             if not player:
                 st.info("ℹ️ You are not assigned to any club at the event start date.")
                 return
 
-            first_name, last_name, dob, gender, club_id, club_name = player
-            dob = pd.to_datetime(dob).date()
-            gender = gender.upper()
-            age = event_start_date.year - dob.year - ((event_start_date.month, event_start_date.day) < (dob.month, dob.day))
+            first_name, last_name, dob, gender, club_id, club_name = (
+                player[c] for c in ("first_name", "last_name", "date_of_birth", "gender", "club_id", "club_name")
+            )
+            age = int(age_at([dob], event_start_date)[0])
 
             st.markdown(f"👤 **Name:** {first_name} {last_name}")
             st.markdown(f"🏟️ **Club at Event Start Date:** {club_name}")
 
-            competitions = {
-                "Open": event_open,
-                "Women": event_women and gender == "F",
-                "Junior": event_junior and age < 18,
-                "Veteran": event_veteran and age >= 45,
-                "Teams": event_teams
-            }
+            competitions = competition_eligibility(selected_event, gender, age)
 
             st.markdown("#### 🏆 Eligible Competitions")
             selected_competitions = [
@@ -86,91 +65,60 @@ def page(selected_event):
                     return
             
                 try:
-                    conn = get_db_connection()
-                    cs = conn.cursor()
-            
-                    registered_comps = []
-            
-                    for comp in selected_competitions:
-                        # Check if already registered
-                        cs.execute("""
-                            SELECT 1
-                            FROM event_registration
-                            WHERE user_id = %s
-                              AND event_id = %s
-                              AND competition_type = %s
-                            LIMIT 1
-                        """, (user_id, event_id, comp))
-            
-                        exists = cs.fetchone()
-                        if exists:
-                            st.warning(f"⚠️ Already registered for {comp} competition.")
-                            continue
-            
-                        # Insert new registration
-                        cs.execute("""
-                            INSERT INTO event_registration (
-                                user_id, event_id, club_id, competition_type,
-                                updated_timestamp, updated_by
-                            )
-                            VALUES (%s, %s, %s, %s, CURRENT_TIMESTAMP, %s)
-                        """, (
-                            user_id, event_id, club_id, comp, user_id
-                        ))
-                        registered_comps.append(comp)
-            
-                    conn.commit()
-            
-                    if registered_comps:
-                        st.success(f"✅ Registered for: {', '.join(registered_comps)}")
-                    else:
-                        st.info("ℹ️ No new registrations submitted.")
-            
+                    result = register_competitions(user_id, event_id, club_id, selected_competitions)
                 except Exception as e:
                     st.error(f"❌ Failed to register: {e}")
-                finally:
-                    cs.close()
-                    conn.close()
+                    return
+
+                registered = [c for c, r in result.items() if r == "registered"]
+                waitlisted = [c for c, r in result.items() if r == "waitlist"]
+                for comp in (c for c, r in result.items() if r == "already"):
+                    st.warning(f"⚠️ Already registered for {comp} competition.")
+                if registered or waitlisted:
+                    bump_event_version(event_id)
+                if registered:
+                    st.success(f"✅ Registered for: {', '.join(registered)}")
+                if waitlisted:
+                    st.info(f"⏳ Competition full, you are on the waitlist for: {', '.join(waitlisted)}")
+                if not (registered or waitlisted):
+                    st.info("ℹ️ No new registrations submitted.")
+
+    # Club admins can enter several members at once
+    if event_status == "Open":
+        render_club_entries(selected_event)
 
     # ✅ Second expander: show registration view
     with st.expander(f"📑 View Registered Competitors", expanded=(event_status in ("Closed", "Complete"))):
-        try:
-            conn = get_db_connection()
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT user_id, email, first_name, last_name, club_name, competition_type
-                FROM event_registration_v
-                WHERE event_id = %s
-                ORDER BY competition_type, last_name, first_name
-            """, (event_id,))
-            rows = cursor.fetchall()
-            cols = [desc[0] for desc in cursor.description]
-            df = pd.DataFrame(rows, columns=cols)
-        except Exception as e:
-            st.error(f"❌ Failed to load registrations: {e}")
-            return
-        finally:
-            cursor.close()
-            conn.close()
+        df = bundle.registrations
     
         if df.empty:
             st.info("No registrations yet.")
         else:
             competitions = df["competition_type"].unique()
             for comp in competitions:
-                comp_df = df[df["competition_type"] == comp][["user_id", "email", "first_name", "last_name", "club_name"]]
-                st.markdown(f"#### 🏆 {comp} Competition ({len(comp_df)} registered)")
+                comp_df = df[df["competition_type"] == comp][["user_id", "email", "first_name", "last_name", "club_name", "reg_status"]]
+                waitlist = int((comp_df["reg_status"] == "waitlist").sum())
+                st.markdown(
+                    f"#### 🏆 {comp} Competition ({len(comp_df) - waitlist} registered"
+                    + (f", {waitlist} waitlisted)" if waitlist else ")")
+                )
                 st.dataframe(comp_df, use_container_width=True)
         
-                # Add CSV download
-                csv = comp_df.to_csv(index=False).encode("utf-8")
+                # CSV is built only on click, then shared until the event changes
                 st.download_button(
                     label=f"⬇️ Download {comp} Registrations as CSV",
-                    data=csv,
+                    data=lambda comp=comp: registrations_csv(event_id, comp),
                     file_name=f"{comp.lower()}_registrations_event_{event_id}.csv",
                     mime="text/csv"
                 )
 
+            st.download_button(
+                label="⬇️ Download All Competitions (zip)",
+                data=lambda: registrations_zip(event_id),
+                file_name=f"registrations_event_{event_id}.zip",
+                mime="application/zip"
+            )
+
             if st.session_state.get("test_mode"):
                 # ✅ Populate test competitors button
                 comp_to_copy = st.selectbox("Select competition to copy from test event", competitions)
@@ -179,12 +127,13 @@ def page(selected_event):
                         conn = get_db_connection()
                         cursor = conn.cursor()
                         cursor.execute(f"""
-                            INSERT INTO event_registration(user_id, club_id, event_id, competition_type)
+                            INSERT IGNORE INTO event_registration(user_id, club_id, event_id, competition_type)
                             SELECT user_id, club_id, %s, %s
                             FROM event_registration
                             WHERE event_id = -1 AND competition_type = %s
                         """, (event_id, comp_to_copy, comp_to_copy))
                         conn.commit()
+                        bump_event_version(event_id)
                         st.success(f"✅ Test competitors for '{comp_to_copy}' added to event {event_id}.")
                         st.rerun()
                     except Exception as e:
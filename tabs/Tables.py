@@ -1,29 +1,70 @@
 import streamlit as st
 import pandas as pd
-from utils import get_db_connection, get_userid
-
-def page(selected_event):
-    event_id = selected_event.get("id")
-
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT *
-            FROM event_table_v
-            WHERE event_id = %s
-            AND round_type = 'Group'
-            ORDER BY competition_type, group_no, rank
-        """, (event_id,))
-        rows = cursor.fetchall()
-        cols = [desc[0] for desc in cursor.description]
-        df = pd.DataFrame(rows, columns=cols)
-    except Exception as e:
-        st.error(f"❌ Failed to load table data: {e}")
-        return
-    finally:
-        cursor.close()
-        conn.close()
+from tabs.live import live_toggle, live_fragment
+from cache_utils import get_event_cache
+from engine.forecast import simulate_groups
+from tabs.grids import cached_grid, grid_styles, label_first_rows, styled
+
+FORECAST_SIMS = 10_000
+QUALIFIERS_PER_GROUP = 2
+TABLE_COLUMNS = ["group_no", "rank", "player", "played", "won", "drawn", "lost", "gf", "ga", "gd", "pts"]
+
+def qualification_odds(bundle, comp):
+    """Forecast table for one competition, keyed by player id, cached per event version."""
+    def load():
+        m = bundle.matches
+        m = m[(m["competition_type"] == comp) & (m["round_type"].str.lower() == "group")]
+        if m.empty:
+            return pd.DataFrame()
+
+        players, idx = pd.factorize(pd.concat([m["player1_id"], m["player2_id"]]), sort=True)
+        home, away = players[:len(m)], players[len(m):]
+        group_of = pd.Series(index=range(len(idx)), dtype=object)
+        group_of[home] = m["group_no"].to_numpy()
+        group_of[away] = m["group_no"].to_numpy()
+
+        final = (m["status"].str.lower() == "final").to_numpy()
+        hg = m["player1_goals"].astype("Float64").to_numpy(dtype=float, na_value=float("nan"))
+        ag = m["player2_goals"].astype("Float64").to_numpy(dtype=float, na_value=float("nan"))
+        hg[~final] = ag[~final] = float("nan")
+
+        fc = simulate_groups(
+            group_of.astype(str).to_numpy(), home, away, hg, ag,
+            n_sims=FORECAST_SIMS, qualifiers=QUALIFIERS_PER_GROUP,
+        )
+        odds = pd.DataFrame(
+            fc.position_prob * 100,
+            columns=[f"P{k + 1} %" for k in range(fc.position_prob.shape[1])],
+        )
+        odds.insert(0, "player_id", idx.to_numpy())
+        odds.insert(0, "group_no", group_of.to_numpy())
+        odds["qualify %"] = fc.qualify_prob * 100
+        return odds.sort_values(["group_no", "qualify %"], ascending=[True, False])
+
+    return get_event_cache().get_or_load(
+        bundle.event.get("id"), f"forecast:{comp}@{bundle.match_state}", load,
+    )
+
+def page(selected_event, bundle):
+    if live_toggle("tables"):
+        live_fragment(bundle, render)
+    else:
+        render(bundle)
+
+def table_grid(comp_df, odds):
+    """The competition's group tables in one frame, groups banded, odds joined on."""
+    frame = comp_df[TABLE_COLUMNS + ["player_id"]].sort_values(["group_no", "rank"], kind="stable").reset_index(drop=True)
+    if not odds.empty:
+        odds = odds.assign(group_no=odds["group_no"].astype(str)).round(1)
+        frame = frame.assign(group_no=frame["group_no"].astype(str)).merge(
+            odds, on=["group_no", "player_id"], how="left",
+        )
+    frame = frame.drop(columns="player_id")
+    styles = grid_styles(frame, "group_no")
+    return label_first_rows(frame, "group_no"), styles
+
+def render(bundle):
+    df = bundle.standings
 
     if df.empty:
         st.info("ℹ️ No groups or matches have been assigned yet.")
@@ -33,11 +74,12 @@ def page(selected_event):
     for comp in competitions:
         comp_df = df[df["competition_type"] == comp]
         with st.expander(f"🏆 {comp} Competition", expanded=(comp == "Open")):
-            groups = comp_df["group_no"].dropna().unique()
-            groups.sort()
-            for group in groups:
-                group_df = comp_df[comp_df["group_no"] == group][[
-                    "rank", "player", "played", "won", "drawn", "lost", "gf", "ga", "gd", "pts"
-                ]]
-                st.markdown(f"#### Group {group}")
-                st.dataframe(group_df, use_container_width=True, hide_index=True)
+            show_odds = st.toggle("🔮 Show qualification odds", key=f"odds_{comp}")
+            grid = cached_grid(
+                bundle, f"tables:{comp}:{show_odds}",
+                lambda: table_grid(comp_df, qualification_odds(bundle, comp) if show_odds else pd.DataFrame()),
+            )
+            st.dataframe(
+                styled(grid), use_container_width=True, hide_index=True,
+                column_config={"group_no": "group"},
+            )
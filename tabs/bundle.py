@@ -0,0 +1,191 @@
+import pandas as pd
+from contextlib import closing
+from dataclasses import dataclass
+
+from utils import get_db_connection
+from cache_utils import get_event_cache
+from engine.knockout import round_rank
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Everything the event detail tabs read, loaded once per event version.
+
+REGISTRATIONS_SQL = """
+    SELECT v.id, v.user_id, v.email, v.first_name, v.last_name, v.club_name, v.club_code,
+           v.competition_type, v.seed_no, v.group_no, r.reg_status
+    FROM event_registration_v v
+    JOIN event_registration r ON r.id = v.id
+    WHERE v.event_id = %s
+    ORDER BY v.competition_type, r.reg_status, v.last_name, v.first_name
+"""
+
+MATCHES_SQL = """
+    SELECT v.*, m.player_1_id AS player1_id, m.player_2_id AS player2_id,
+        case when v.round_type = 'Group' then concat('Group ', v.group_no) else v.round_type end as group_label
+    FROM event_matches m
+    JOIN event_matches_v v ON v.id = m.id
+    WHERE m.event_id = %s
+"""
+
+# maintained incrementally by admin/standings.py; a primary-key range read
+STANDINGS_SQL = """
+    SELECT event_id, competition_type, group_no, player_id, player,
+           rank_no AS `rank`, played, won, drawn, lost, gf, ga, gd, pts
+    FROM event_standings
+    WHERE event_id = %s
+    ORDER BY competition_type, group_no, rank_no
+"""
+
+RESULTS_SQL = """
+    SELECT *
+    FROM event_result_v
+    WHERE event_id = %s
+    ORDER BY event_id, competition_type, round_no DESC, final
+"""
+
+PLAYER_SQL = """
+    SELECT first_name, last_name, date_of_birth, gender, club_id, club_name
+    FROM player_club_v
+    WHERE id = %s
+      AND player_status in ('Active', 'Approved')
+      AND %s BETWEEN valid_from AND valid_to
+    LIMIT 1
+"""
+
+# Live refresh (tabs/live.py): a covered count/max probe, then only the
+# changed rows.  Both use event_matches (event_id, updated_timestamp).
+MATCH_PROBE_SQL = """
+    SELECT count(*), min(id), max(id), coalesce(sum(version), 0), max(updated_timestamp)
+    FROM event_matches
+    WHERE event_id = %s
+"""
+
+MATCH_CHANGES_SQL = """
+    SELECT v.*, m.player_1_id AS player1_id, m.player_2_id AS player2_id,
+        case when v.round_type = 'Group' then concat('Group ', v.group_no) else v.round_type end as group_label
+    FROM event_matches m
+    JOIN event_matches_v v ON v.id = m.id
+    WHERE m.event_id = %s
+      AND m.updated_timestamp >= %s
+"""
+
+# nullable integer columns per frame
+INT_COLUMNS = {
+    "registrations": ["id", "user_id", "seed_no"],
+    "matches": ["id", "round_no", "player1_id", "player2_id", "player1_goals", "player2_goals"],
+    "standings": ["player_id", "rank", "played", "won", "drawn", "lost", "gf", "ga", "gd", "pts"],
+    "results": ["round_no"],
+}
+
+
+@dataclass
+class EventBundle:
+    event: dict
+    version: int
+    registrations: pd.DataFrame
+    matches: pd.DataFrame
+    standings: pd.DataFrame
+    results: pd.DataFrame
+    player: dict | None = None
+    # live mode's (match count, last update); part of derived cache keys
+    match_state: tuple = ()
+
+
+def _frame(cur, sql, params, name):
+    cur.execute(sql, params)
+    rows = cur.fetchall()
+    cols = [d[0] for d in cur.description]
+    df = pd.DataFrame(rows, columns=cols)
+    for col in INT_COLUMNS.get(name, []):
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype("Int64")
+    return df
+
+
+def _sort_matches(df):
+    """Order by competition, canonical stage (shared with fixture generation), group, round."""
+    if df.empty:
+        return df
+    df["sort_order"] = df["round_type"].map(round_rank)
+    return df.sort_values(
+        ["competition_type", "sort_order", "group_no", "round_no"], kind="stable"
+    ).reset_index(drop=True)
+
+
+def _load_event_frames(event_id) -> dict:
+    """Run the four event-scoped reads on a single connection."""
+    with closing(get_db_connection()) as conn, closing(conn.cursor()) as cur:
+        return {
+            "registrations": _frame(cur, REGISTRATIONS_SQL, (event_id,), "registrations"),
+            "matches": _sort_matches(_frame(cur, MATCHES_SQL, (event_id,), "matches")),
+            "standings": _frame(cur, STANDINGS_SQL, (event_id,), "standings"),
+            "results": _frame(cur, RESULTS_SQL, (event_id,), "results"),
+        }
+
+
+def probe_matches(event_id) -> tuple:
+    """``(match_count, min_id, max_id, version_sum, last_updated)`` for the event.
+
+    Every score save bumps a row version, so ``version_sum`` moves even when
+    two edits land in the same (whole) second of ``updated_timestamp``.
+    """
+    with closing(get_db_connection()) as conn, closing(conn.cursor()) as cur:
+        cur.execute(MATCH_PROBE_SQL, (event_id,))
+        return cur.fetchone()
+
+
+def load_match_changes(event_id, since) -> pd.DataFrame:
+    """Matches updated at or after ``since`` (timestamps are whole seconds,
+    so rows from the last seen second are re-read rather than missed)."""
+    with closing(get_db_connection()) as conn, closing(conn.cursor()) as cur:
+        return _frame(cur, MATCH_CHANGES_SQL, (event_id, since), "matches")
+
+
+def load_matches(event_id) -> pd.DataFrame:
+    with closing(get_db_connection()) as conn, closing(conn.cursor()) as cur:
+        return _sort_matches(_frame(cur, MATCHES_SQL, (event_id,), "matches"))
+
+
+def load_standings(event_id) -> pd.DataFrame:
+    with closing(get_db_connection()) as conn, closing(conn.cursor()) as cur:
+        return _frame(cur, STANDINGS_SQL, (event_id,), "standings")
+
+
+def merge_matches(matches: pd.DataFrame, changes: pd.DataFrame) -> pd.DataFrame:
+    """Replace rows of ``matches`` by id with ``changes`` and restore the tab order."""
+    if changes.empty:
+        return matches
+    kept = matches[~matches["id"].isin(changes["id"])].drop(columns="sort_order", errors="ignore")
+    return _sort_matches(pd.concat([kept, changes[kept.columns.intersection(changes.columns)]], ignore_index=True))
+
+
+def _load_player(user_id, event_start_date) -> dict | None:
+    with closing(get_db_connection()) as conn, closing(conn.cursor()) as cur:
+        cur.execute(PLAYER_SQL, (user_id, event_start_date))
+        row = cur.fetchone()
+        if not row:
+            return None
+        return dict(zip([d[0] for d in cur.description], row))
+
+
+def load_event_bundle(selected_event: dict, user_id=None) -> EventBundle:
+    """Return the event's frames (shared across sessions) plus the caller's club row.
+
+    A cold open costs one connection for the event frames and one small query
+    for the player; a warm open only the player query.
+    """
+    event_id = selected_event.get("id")
+    cache = get_event_cache()
+    version = cache.version(event_id)
+    frames = cache.get_or_load(event_id, "bundle", lambda: _load_event_frames(event_id))
+
+    player = None
+    if user_id:
+        start = pd.to_datetime(selected_event.get("event_start_date")).date()
+        player = _load_player(user_id, start)
+
+    return EventBundle(
+        event=selected_event,
+        version=version,
+        player=player,
+        **{name: df.copy() for name, df in frames.items()},
+    )
@@ -0,0 +1,160 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+from contextlib import closing
+from utils import get_db_connection, get_admin_club_ids, get_userid
+from cache_utils import bump_event_version
+from tabs.registration import COMPETITIONS, age_at, competition_eligibility, register_entries
+
+# Player statuses that may be entered, as in the single-player path
+ACTIVE_STATUSES = ("Active", "Approved")
+
+# Competitions whose eligibility depends on the player's age
+AGE_COMPETITIONS = ("Junior", "Veteran")
+
+
+def fetch_members(club_ids) -> pd.DataFrame:
+    """Every membership row of the given clubs (all validity periods)."""
+    marks = ", ".join(["%s"] * len(club_ids))
+    with closing(get_db_connection()) as conn, closing(conn.cursor()) as cur:
+        cur.execute(
+            f"""
+            SELECT id AS user_id, first_name, last_name, date_of_birth, gender,
+                   club_id, club_name, player_status, valid_from, valid_to
+            FROM player_club_v
+            WHERE club_id IN ({marks})
+            """,
+            list(club_ids),
+        )
+        cols = [d[0] for d in cur.description]
+        return pd.DataFrame(cur.fetchall(), columns=cols)
+
+
+def check_entries(requests: pd.DataFrame, members: pd.DataFrame, selected_event: dict) -> pd.DataFrame:
+    """Attach each requested (user_id, competition_type) its member row and a reject reason.
+
+    All checks run column-wise over the batch: membership of one of the
+    admin's clubs valid on the event start date, then eligibility for the
+    competition (gender, age at the start date, competition offered); a
+    missing date of birth only rejects the age-limited competitions.
+    ``reason`` is empty for rows that can be registered.
+    """
+    start = pd.to_datetime(selected_event.get("event_start_date"))
+    m = members.copy()
+    m["valid"] = (
+        m["player_status"].isin(ACTIVE_STATUSES)
+        & (pd.to_datetime(m["valid_from"]) <= start)
+        & (start <= pd.to_datetime(m["valid_to"]))
+    )
+    # one row per player: their valid membership if they have one
+    m = m.sort_values("valid", ascending=False).drop_duplicates("user_id")
+
+    out = requests.merge(m, on="user_id", how="left")
+    found = out["club_id"].notna().to_numpy()
+    valid = out["valid"].fillna(False).to_numpy(dtype=bool)
+
+    has_dob = found & out["date_of_birth"].notna().to_numpy()
+    age = np.full(len(out), -1)
+    if has_dob.any():
+        age[has_dob] = age_at(out.loc[has_dob, "date_of_birth"], start)
+    rules = competition_eligibility(selected_event, out["gender"].fillna(""), age)
+    eligible = np.zeros(len(out), dtype=bool)
+    known = out["competition_type"].isin(COMPETITIONS).to_numpy()
+    for comp, ok in rules.items():
+        pick = (out["competition_type"] == comp).to_numpy()
+        eligible[pick] = ok[pick]
+
+    out["reason"] = np.select(
+        [
+            out.duplicated(["user_id", "competition_type"]).to_numpy(),
+            ~known,
+            ~found,
+            ~valid,
+            ~has_dob & out["competition_type"].isin(AGE_COMPETITIONS).to_numpy(),
+            ~eligible,
+        ],
+        [
+            "duplicate row",
+            "unknown competition",
+            "not a member of your clubs",
+            "club membership not valid on the event start date",
+            "not eligible (no date of birth)",
+            "not eligible for this competition",
+        ],
+        default="",
+    )
+    return out
+
+
+def parse_upload(upload) -> pd.DataFrame:
+    """``user_id, competition_type`` rows from an uploaded CSV."""
+    df = pd.read_csv(upload)
+    df.columns = [c.strip().lower() for c in df.columns]
+    missing = {"user_id", "competition_type"} - set(df.columns)
+    if missing:
+        raise ValueError(f"missing column(s): {', '.join(sorted(missing))}")
+    df = df[["user_id", "competition_type"]].copy()
+    df["user_id"] = pd.to_numeric(df["user_id"], errors="coerce").astype("Int64")
+    df["competition_type"] = df["competition_type"].astype(str).str.strip().str.title()
+    return df.dropna(subset=["user_id"]).astype({"user_id": int})
+
+
+def render_club_entries(selected_event: dict):
+    club_ids = get_admin_club_ids()
+    if not club_ids:
+        return
+    event_id = selected_event.get("id")
+
+    with st.expander("👥 Club Entries"):
+        members = fetch_members(club_ids)
+        if members.empty:
+            st.info("ℹ️ Your clubs have no members.")
+            return
+
+        source = st.radio("add players from", ["club members", "CSV upload"], horizontal=True, key="club_entry_source")
+        requests = pd.DataFrame(columns=["user_id", "competition_type"])
+        if source == "club members":
+            roster = members.drop_duplicates("user_id").sort_values(["last_name", "first_name"])
+            labels = dict(zip(roster["user_id"], roster["first_name"] + " " + roster["last_name"] + " (" + roster["club_name"] + ")"))
+            picked = st.multiselect("members", list(labels), format_func=labels.get, key="club_entry_members")
+            comps = st.multiselect("competitions", list(COMPETITIONS), key="club_entry_comps")
+            requests = pd.DataFrame(
+                [(u, c) for u in picked for c in comps], columns=["user_id", "competition_type"],
+            )
+        else:
+            st.caption("CSV columns: user_id, competition_type")
+            upload = st.file_uploader("competitors CSV", type="csv", key="club_entry_csv")
+            if upload is not None:
+                try:
+                    requests = parse_upload(upload)
+                except Exception as exc:
+                    st.error(f"❌ could not read CSV: {exc}")
+                    return
+
+        if requests.empty or not st.button("📝 Register Selected"):
+            return
+
+        checked = check_entries(requests, members, selected_event)
+        ok = checked["reason"] == ""
+        try:
+            result = register_entries(
+                event_id,
+                zip(checked.loc[ok, "user_id"].tolist(), checked.loc[ok, "club_id"].astype(int).tolist(),
+                    checked.loc[ok, "competition_type"].tolist()),
+                get_userid(),
+            )
+        except Exception as exc:
+            st.error(f"❌ Failed to register: {exc}")
+            return
+
+        checked.loc[ok, "result"] = result
+        checked.loc[~ok, "result"] = "rejected: " + checked.loc[~ok, "reason"]
+        if any(r in ("registered", "waitlist") for r in result):
+            bump_event_version(event_id)
+
+        counts = checked["result"].str.split(":").str[0].value_counts()
+        st.success("✅ " + ", ".join(f"{n} {r}" for r, n in counts.items()))
+        st.dataframe(
+            checked[["user_id", "first_name", "last_name", "competition_type", "result"]],
+            use_container_width=True, hide_index=True,
+        )
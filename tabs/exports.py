@@ -0,0 +1,73 @@
+import csv
+import io
+import zipfile
+from contextlib import closing
+from utils import get_db_connection
+from cache_utils import get_event_cache
+
+# Rows fetched from the server per round trip while exporting
+EXPORT_FETCH_ROWS = 1000
+
+EXPORT_SQL = """
+    SELECT v.competition_type, v.user_id, v.email, v.first_name, v.last_name,
+           v.club_name, v.club_code, v.seed_no, v.group_no, r.reg_status
+    FROM event_registration_v v
+    JOIN event_registration r ON r.id = v.id
+    WHERE v.event_id = %s {scope}
+    ORDER BY v.competition_type, r.reg_status, v.last_name, v.first_name
+"""
+
+
+def _rows(event_id, comp=None):
+    """Yield the header, then registration rows in fetchmany chunks."""
+    scope, params = "", (event_id,)
+    if comp is not None:
+        scope, params = "AND v.competition_type = %s", (event_id, comp)
+    with closing(get_db_connection()) as conn, closing(conn.cursor(buffered=False)) as cur:
+        cur.execute(EXPORT_SQL.format(scope=scope), params)
+        yield [d[0] for d in cur.description]
+        while True:
+            chunk = cur.fetchmany(EXPORT_FETCH_ROWS)
+            if not chunk:
+                break
+            yield from chunk
+
+
+def _write_csv(out, rows):
+    writer = csv.writer(out)
+    for row in rows:
+        writer.writerow(row)
+
+
+def registrations_csv(event_id, comp) -> bytes:
+    def build():
+        out = io.StringIO()
+        _write_csv(out, _rows(event_id, comp))
+        return out.getvalue().encode("utf-8")
+    return get_event_cache().get_or_load(event_id, f"export:{comp}", build)
+
+
+def registrations_zip(event_id) -> bytes:
+    """One CSV per competition in a zip, written entry by entry as rows arrive."""
+    def build():
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+            rows = _rows(event_id)
+            header = next(rows)
+            entry, writer, current = None, None, None
+            for row in rows:
+                if row[0] != current:
+                    if entry is not None:
+                        entry.close()
+                    current = row[0]
+                    entry = io.TextIOWrapper(
+                        zf.open(f"{str(current).lower()}_registrations_event_{event_id}.csv", "w"),
+                        encoding="utf-8", newline="",
+                    )
+                    writer = csv.writer(entry)
+                    writer.writerow(header)
+                writer.writerow(row)
+            if entry is not None:
+                entry.close()
+        return buf.getvalue()
+    return get_event_cache().get_or_load(event_id, "export:zip", build)
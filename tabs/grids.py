@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+from cache_utils import get_event_cache
+
+WINNER_STYLE = "background-color: #cce4ff"
+# every other group is shaded so groups read apart in one grid
+BAND_STYLE = "background-color: #f3f5f8"
+
+
+def grid_styles(frame: pd.DataFrame, group_col: str | None = None) -> pd.DataFrame:
+    """Empty style frame for ``frame``, with alternate groups of ``group_col`` banded."""
+    styles = np.full(frame.shape, "", dtype=object)
+    if group_col is not None and not frame.empty:
+        band = pd.factorize(frame[group_col])[0] % 2 == 1
+        styles[band] = BAND_STYLE
+    return pd.DataFrame(styles, index=frame.index, columns=frame.columns)
+
+
+def label_first_rows(frame: pd.DataFrame, group_col: str) -> pd.DataFrame:
+    """Show the group label on the first row of each group only."""
+    first = frame[group_col].ne(frame[group_col].shift())
+    frame[group_col] = frame[group_col].where(first, "")
+    return frame
+
+
+def mark(styles: pd.DataFrame, column: str, mask) -> None:
+    """Set WINNER_STYLE on ``column`` where ``mask`` (NA counts as False)."""
+    mask = pd.Series(mask, index=styles.index).fillna(False).to_numpy(dtype=bool)
+    styles.loc[mask, column] = WINNER_STYLE
+
+
+def styled(grid: tuple):
+    """Styler for a cached ``(frame, styles)`` pair; one call, no per-row work."""
+    frame, styles = grid
+    return frame.style.apply(lambda _: styles, axis=None)
+
+
+def cached_grid(bundle, view: str, build) -> tuple:
+    """``build()``'s ``(frame, styles)``, shared per event version and match state."""
+    key = f"{view}@{bundle.match_state}"
+    return get_event_cache().get_or_load(bundle.event.get("id"), key, build)
@@ -0,0 +1,59 @@
+import dataclasses
+import streamlit as st
+from tabs.bundle import (
+    EventBundle, probe_matches, load_match_changes, load_matches, load_standings, merge_matches,
+)
+
+# Seconds between live refreshes of the Scores / Tables sections
+LIVE_REFRESH_SECONDS = 10
+
+
+def _state_key(event_id) -> str:
+    return f"live_frames_{event_id}"
+
+
+def live_toggle(tab: str) -> bool:
+    return st.toggle("📡 Live", key=f"live_{tab}", help=f"refresh every {LIVE_REFRESH_SECONDS}s")
+
+
+def refresh(bundle: EventBundle) -> EventBundle:
+    """Bring the session's copy of the matches (and standings) up to date.
+
+    Each call costs one indexed count/min/max/version probe; only when it
+    moves are the changed matches fetched and merged.  When the set of match ids moves
+    (fixtures generated, re-generated or deleted), or a changed row is not
+    in the held frame, the matches are reloaded instead.
+    """
+    event_id = bundle.event.get("id")
+    key = _state_key(event_id)
+    state = st.session_state.get(key)
+    count, low, high, edits, last = probe_matches(event_id)
+    ids = (count, low, high)
+
+    if state is None or state["version"] != bundle.version:
+        state = {"version": bundle.version, "ids": ids, "edits": edits, "seen": last,
+                 "matches": bundle.matches, "standings": bundle.standings}
+    elif (ids, edits, last) != (state["ids"], state["edits"], state["seen"]):
+        matches = None
+        if ids == state["ids"] and last is not None:
+            changes = load_match_changes(event_id, state["seen"] or last)
+            if changes["id"].isin(state["matches"]["id"]).all():
+                matches = merge_matches(state["matches"], changes)
+        state["matches"] = load_matches(event_id) if matches is None else matches
+        state["standings"] = load_standings(event_id)
+        state["ids"], state["edits"], state["seen"] = ids, edits, last
+    st.session_state[key] = state
+
+    return dataclasses.replace(
+        bundle, matches=state["matches"], standings=state["standings"],
+        match_state=(*state["ids"], state["edits"], state["seen"]),
+    )
+
+
+@st.fragment(run_every=LIVE_REFRESH_SECONDS)
+def live_fragment(bundle: EventBundle, render):
+    """Rerun only ``render(bundle)`` on a timer, not the whole events page."""
+    fresh = refresh(bundle)
+    render(fresh)
+    seen = st.session_state[_state_key(fresh.event.get("id"))]["seen"]
+    st.caption(f"📡 live · last change {seen or '-'}")
@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+from contextlib import closing
+import mysql.connector
+from mysql.connector import errorcode
+from utils import get_db_connection
+
+# Attempts per registration when concurrent sign-ups deadlock
+REGISTER_RETRIES = 3
+
+JUNIOR_MAX_AGE = 18      # under
+VETERAN_MIN_AGE = 45     # at least
+
+COMPETITIONS = ("Open", "Women", "Junior", "Veteran", "Teams")
+
+
+def age_at(dob, on) -> np.ndarray:
+    """Whole years between each date of birth in ``dob`` and the date ``on``."""
+    dob = pd.to_datetime(pd.Series(dob))
+    before_birthday = (dob.dt.month * 100 + dob.dt.day) > (on.month * 100 + on.day)
+    return (on.year - dob.dt.year - before_birthday).to_numpy()
+
+
+def competition_eligibility(selected_event: dict, gender, age) -> dict:
+    """``{competition: bool array}`` for players of the given gender and age.
+
+    Works on scalars or whole columns; a competition the event does not run
+    is False for everyone.
+    """
+    gender = np.char.upper(np.asarray(gender, dtype=str))
+    age = np.asarray(age)
+    offered = {c: bool(selected_event.get(f"event_{c.lower()}", False)) for c in COMPETITIONS}
+    everyone = np.ones(gender.shape, dtype=bool)
+    return {
+        "Open": offered["Open"] & everyone,
+        "Women": offered["Women"] & (gender == "F"),
+        "Junior": offered["Junior"] & (age < JUNIOR_MAX_AGE),
+        "Veteran": offered["Veteran"] & (age >= VETERAN_MIN_AGE),
+        "Teams": offered["Teams"] & everyone,
+    }
+
+
+def register_entries(event_id, entries, updated_by) -> list:
+    """Register ``(user_id, club_id, competition)`` entries in one transaction.
+
+    Capacity rows of the competitions involved are locked (in a fixed order),
+    so concurrent sign-ups for a competition queue briefly while counting.
+    Each row goes in with INSERT IGNORE backed by the unique (event_id,
+    competition_type, user_id) key, so repeats are no-ops; a row another
+    request inserted first (rowcount 0) is reported as 'already' and does not
+    count towards capacity.  Entries beyond a competition's capacity are
+    waitlisted in the order given.  Returns one of 'registered' / 'waitlist'
+    / 'already' per entry.
+    """
+    entries = list(entries)
+    if not entries:
+        return []
+    comps = sorted({comp for _, _, comp in entries})
+    users = sorted({user_id for user_id, _, _ in entries})
+    comp_marks = ", ".join(["%s"] * len(comps))
+    user_marks = ", ".join(["%s"] * len(users))
+
+    for attempt in range(REGISTER_RETRIES):
+        with closing(get_db_connection()) as conn, closing(conn.cursor()) as cur:
+            try:
+                cur.execute(f"""
+                    SELECT competition_type, capacity
+                    FROM event_competition_capacity
+                    WHERE event_id = %s AND competition_type IN ({comp_marks})
+                    ORDER BY competition_type
+                    FOR UPDATE
+                """, (event_id, *comps))
+                capacity = dict(cur.fetchall())
+
+                cur.execute(f"""
+                    SELECT competition_type, count(*)
+                    FROM event_registration
+                    WHERE event_id = %s AND competition_type IN ({comp_marks})
+                      AND reg_status = 'registered'
+                    GROUP BY competition_type
+                """, (event_id, *comps))
+                taken = {c: int(n) for c, n in cur.fetchall()}
+
+                cur.execute(f"""
+                    SELECT user_id, competition_type
+                    FROM event_registration
+                    WHERE event_id = %s AND competition_type IN ({comp_marks})
+                      AND user_id IN ({user_marks})
+                """, (event_id, *comps, *users))
+                existing = set(cur.fetchall())
+
+                result = []
+                for user_id, club_id, comp in entries:
+                    if (user_id, comp) in existing:
+                        result.append("already")
+                        continue
+                    existing.add((user_id, comp))
+                    status = "registered"
+                    if comp in capacity and taken.get(comp, 0) >= capacity[comp]:
+                        status = "waitlist"
+                    cur.execute("""
+                        INSERT IGNORE INTO event_registration (
+                            user_id, event_id, club_id, competition_type, reg_status,
+                            updated_timestamp, updated_by
+                        )
+                        VALUES (%s, %s, %s, %s, %s, CURRENT_TIMESTAMP, %s)
+                    """, (user_id, event_id, club_id, comp, status, updated_by))
+                    if cur.rowcount == 0:
+                        result.append("already")
+                        continue
+                    if status == "registered":
+                        taken[comp] = taken.get(comp, 0) + 1
+                    result.append(status)
+                conn.commit()
+                return result
+            except mysql.connector.errors.DatabaseError as e:
+                conn.rollback()
+                if e.errno != errorcode.ER_LOCK_DEADLOCK or attempt == REGISTER_RETRIES - 1:
+                    raise
+    return []
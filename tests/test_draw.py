@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from engine.draw import draw_groups, draw_metrics, group_labels
+
+
+def _pot(strength, n_groups):
+    rank = np.empty(len(strength), dtype=int)
+    rank[np.argsort(-np.asarray(strength), kind="stable")] = np.arange(len(strength))
+    return rank // n_groups
+
+
+@pytest.mark.parametrize("n, n_groups", [(16, 4), (13, 4), (30, 8), (7, 2)])
+def test_group_sizes_differ_by_at_most_one(n, n_groups):
+    rng = np.random.default_rng(n)
+    draw = draw_groups(rng.random(n), n_groups, club=rng.integers(0, 4, n), rng=0)
+    sizes = np.bincount(draw.group, minlength=n_groups)
+    assert sizes.max() - sizes.min() <= 1
+    assert draw.metrics.size_range == sizes.max() - sizes.min()
+
+
+def test_each_pot_spreads_over_distinct_groups():
+    rng = np.random.default_rng(3)
+    strength = rng.permutation(24).astype(float)
+    draw = draw_groups(strength, 6, club=rng.integers(0, 5, 24), rng=0)
+    pot = _pot(strength, 6)
+    for k in np.unique(pot):
+        groups = draw.group[pot == k]
+        assert len(set(groups.tolist())) == len(groups)
+
+
+def test_clubs_are_separated_when_possible():
+    strength = np.arange(8, 0, -1, dtype=float)
+    club = ["a", "a", "b", "b", "c", "c", "d", "d"]        # snake puts each pair together
+    draw = draw_groups(strength, 4, club=club, rng=0)
+    assert draw.metrics.club_clashes == 0
+    assert draw_metrics(draw.group, strength, club).club_clashes == 0
+
+
+def test_unknown_clubs_never_clash():
+    draw = draw_groups(np.ones(6), 2, club=[None, None, None, float("nan"), "x", "y"], rng=0)
+    assert draw.metrics.club_clashes == 0
+
+
+def test_empty_field():
+    draw = draw_groups([], 4)
+    assert len(draw.group) == 0 and draw.swaps == 0
+
+
+def test_group_labels_continue_past_z():
+    labels = group_labels(28)
+    assert labels[:3] == ["A", "B", "C"]
+    assert labels[25:] == ["Z", "AA", "AB"]
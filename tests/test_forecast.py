@@ -0,0 +1,41 @@
+import numpy as np
+
+from engine.forecast import simulate_groups
+
+NAN = np.nan
+
+
+def test_probabilities_sum_to_one():
+    fc = simulate_groups(
+        [0, 0, 0, 1, 1, 1], home=[0, 0, 1, 3, 3, 4], away=[1, 2, 2, 4, 5, 5],
+        home_goals=[NAN] * 6, away_goals=[NAN] * 6, n_sims=2000, seed=0,
+    )
+    assert np.allclose(fc.position_prob.sum(axis=1), 1.0)
+    # every place in a group is taken exactly once per simulation
+    assert np.allclose(fc.position_prob[:3].sum(axis=0), 1.0)
+    assert np.allclose(fc.qualify_prob, fc.position_prob[:, :2].sum(axis=1))
+
+
+def test_finished_group_is_certain():
+    fc = simulate_groups(
+        [0, 0, 0], home=[0, 0, 1], away=[1, 2, 2],
+        home_goals=[2, 3, 1], away_goals=[0, 0, 0], n_sims=500, seed=0,
+    )
+    assert fc.position_prob[:, :3].tolist() == [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
+
+
+def test_unbeatable_lead_always_qualifies():
+    # player 0 has six points with one game left; the others can reach four at most
+    fc = simulate_groups(
+        [0, 0, 0], home=[0, 0, 1], away=[1, 2, 2],
+        home_goals=[1, 1, NAN], away_goals=[0, 0, NAN], n_sims=1000, seed=0, qualifiers=1,
+    )
+    assert fc.qualify_prob[0] == 1.0
+
+
+def test_ratings_favour_the_stronger_player():
+    fc = simulate_groups(
+        [0, 0], home=[0], away=[1], home_goals=[NAN], away_goals=[NAN],
+        n_sims=4000, qualifiers=1, ratings=[1900, 1300], seed=0,
+    )
+    assert fc.qualify_prob[0] > 0.8
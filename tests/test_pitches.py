@@ -0,0 +1,36 @@
+import numpy as np
+
+from engine.pitches import schedule_matches
+from engine.round_robin import round_robin
+
+
+def _check(p1, p2, sched, n_pitches, rest_slots):
+    p1, p2 = np.asarray(p1), np.asarray(p2)
+    assert (sched.pitch >= 1).all() and (sched.pitch <= n_pitches).all()
+    slot_pitch = set(zip(sched.slot.tolist(), sched.pitch.tolist()))
+    assert len(slot_pitch) == len(p1)                       # one match per pitch and slot
+    for pid in np.unique(np.concatenate([p1, p2])):
+        slots = np.sort(sched.slot[(p1 == pid) | (p2 == pid)])
+        assert (np.diff(slots) >= rest_slots + 1).all()
+
+
+def test_round_robin_schedule_respects_pitches_and_rest():
+    fx = round_robin(np.repeat(np.arange(3), 5))
+    sched = schedule_matches(fx.home, fx.away, n_pitches=4, rest_slots=1, priority=fx.round_no)
+    _check(fx.home, fx.away, sched, 4, 1)
+    assert sched.n_slots >= sched.lower_bound
+
+
+def test_single_pitch_runs_matches_back_to_back():
+    sched = schedule_matches([1, 3], [2, 4], n_pitches=1)
+    assert sorted(sched.slot.tolist()) == [0, 1]
+    assert sched.n_slots == sched.lower_bound == 2
+
+
+def test_busy_players_start_later():
+    sched = schedule_matches([1, 3], [2, 4], n_pitches=2, start_slot=5, busy_until={1: 8})
+    assert sched.slot.tolist() == [8, 5]
+
+
+def test_empty_fixture_list():
+    assert schedule_matches([], [], n_pitches=2).n_slots == 0
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from engine.rating import INITIAL_RATING, K_FACTOR, expected, match_delta, replay
+
+P1 = [1, 2, 1, 3, 2, 1]
+P2 = [2, 3, 3, 4, 4, 4]
+G1 = [2, 0, 1, 3, 1, 0]
+G2 = [1, 0, 4, 0, 1, 2]
+
+
+def test_replay_matches_incremental_updates():
+    full = replay(P1, P2, G1, G2)
+    for split in range(1, len(P1)):
+        head = replay(P1[:split], P2[:split], G1[:split], G2[:split])
+        tail = replay(
+            P1[split:], P2[split:], G1[split:], G2[split:],
+            initial=dict(zip(head.players.tolist(), head.rating.tolist())),
+        )
+        rating = dict(zip(full.players.tolist(), full.rating.tolist()))
+        for pid, r in zip(tail.players.tolist(), tail.rating.tolist()):
+            assert r == pytest.approx(rating[pid])
+        assert np.allclose(np.concatenate([head.delta1, tail.delta1]), full.delta1)
+
+
+def test_replay_deltas_follow_match_delta():
+    r = {p: INITIAL_RATING for p in (1, 2, 3, 4)}
+    result = replay(P1, P2, G1, G2)
+    for k, (a, b, g1, g2) in enumerate(zip(P1, P2, G1, G2)):
+        d = float(match_delta(r[a], r[b], g1, g2))
+        assert result.delta1[k] == pytest.approx(d)
+        r[a] += d
+        r[b] -= d
+
+
+def test_ratings_are_zero_sum_and_count_games():
+    result = replay(P1, P2, G1, G2)
+    assert result.rating.sum() == pytest.approx(INITIAL_RATING * len(result.players))
+    assert result.matches.tolist() == [3, 3, 3, 3]
+    assert np.allclose(result.delta2, -result.delta1)
+
+
+def test_draw_between_equals_moves_nothing_and_margin_scales_a_win():
+    assert float(match_delta(1500, 1500, 2, 2)) == 0.0
+    assert float(match_delta(1500, 1500, 1, 0)) == pytest.approx(K_FACTOR * (1 + np.log(2)) / 2)
+    assert float(match_delta(1500, 1500, 5, 0)) > float(match_delta(1500, 1500, 1, 0))
+
+
+def test_expected_score_is_symmetric():
+    assert float(expected(1600, 1400)) + float(expected(1400, 1600)) == pytest.approx(1.0)
@@ -0,0 +1,66 @@
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from engine.round_robin import circle_table, round_robin
+
+
+@pytest.mark.parametrize("size", [2, 3, 4, 5, 6, 7, 8])
+def test_every_pair_meets_once_per_leg(size):
+    fx = round_robin(np.zeros(size, dtype=int))
+    pairs = sorted(tuple(sorted(p)) for p in zip(fx.home.tolist(), fx.away.tolist()))
+    assert pairs == list(combinations(range(size), 2))
+
+
+@pytest.mark.parametrize("size", [3, 4, 5, 6, 8])
+def test_no_player_twice_in_a_round(size):
+    fx = round_robin(np.zeros(size, dtype=int))
+    for rnd in np.unique(fx.round_no):
+        pick = fx.round_no == rnd
+        players = np.concatenate([fx.home[pick], fx.away[pick]])
+        assert len(players) == len(set(players.tolist()))
+    assert fx.rounds == size - 1 + size % 2
+
+
+@pytest.mark.parametrize("size", [3, 4, 5, 6, 7, 8])
+def test_home_counts_within_one(size):
+    fx = round_robin(np.zeros(size, dtype=int))
+    home = np.bincount(fx.home, minlength=size)
+    assert home.max() - home.min() <= 1
+
+
+def test_double_round_robin_swaps_home_and_away():
+    fx = round_robin(np.zeros(4, dtype=int), legs=2)
+    first = set(zip(fx.home[fx.leg == 1].tolist(), fx.away[fx.leg == 1].tolist()))
+    second = set(zip(fx.away[fx.leg == 2].tolist(), fx.home[fx.leg == 2].tolist()))
+    assert first == second
+    assert (np.bincount(fx.home) == 3).all()
+    assert fx.round_no[fx.leg == 2].min() == fx.round_no[fx.leg == 1].max() + 1
+
+
+def test_groups_are_scheduled_separately():
+    group_of = np.array(["B", "A", "A", "B", "A", "B", "A"])
+    fx = round_robin(group_of)
+    assert fx.labels.tolist() == ["A", "B"]
+    assert (group_of[fx.home] == fx.labels[fx.group]).all()
+    assert (group_of[fx.away] == fx.labels[fx.group]).all()
+    assert np.bincount(fx.group).tolist() == [6, 3]
+
+
+def test_byes_kept_on_request():
+    fx = round_robin(np.zeros(5, dtype=int), keep_byes=True)
+    byes = (fx.home < 0) | (fx.away < 0)
+    assert byes.sum() == 5
+    sitting_out = np.where(fx.home[byes] < 0, fx.away[byes], fx.home[byes])
+    assert sorted(sitting_out.tolist()) == list(range(5))
+
+
+def test_single_player_groups_have_no_fixtures():
+    assert len(round_robin(np.array(["A", "B"]))) == 0
+
+
+def test_circle_table_covers_every_slot_each_round():
+    home, away = circle_table(6)
+    slots = np.sort(np.hstack([home, away]), axis=1)
+    assert (slots == np.arange(6)).all()
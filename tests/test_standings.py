@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from engine.standings import compute_standings
+
+NAN = np.nan
+
+
+def test_table_columns_count_only_finished_matches():
+    st = compute_standings(
+        [0, 0, 0], home=[0, 1, 0], away=[1, 2, 2],
+        home_goals=[2, 1, NAN], away_goals=[0, 1, NAN],
+    )
+    assert st.played.tolist() == [1, 2, 1]
+    assert st.won.tolist() == [1, 0, 0]
+    assert st.drawn.tolist() == [0, 1, 1]
+    assert st.pts.tolist() == [3, 1, 1]
+    assert st.gd.tolist() == [2, -2, 0]
+    assert st.rank.tolist() == [1, 3, 2]
+
+
+def test_head_to_head_breaks_a_tie_on_points_only():
+    # 0 and 1 both finish on six points; 0 has the better goal difference,
+    # but 1 won their meeting
+    group = [0, 0, 0, 0]
+    home, away = [1, 0, 2, 0, 1], [0, 2, 1, 3, 3]
+    hg, ag = [1, 5, 1, 1, 1], [0, 0, 0, 0, 0]
+    by_h2h = compute_standings(group, home, away, hg, ag, order=("pts", "h2h_pts"))
+    assert by_h2h.pts[0] == by_h2h.pts[1] == 6
+    assert by_h2h.rank[:2].tolist() == [2, 1]
+
+    by_gd = compute_standings(group, home, away, hg, ag, order=("pts", "gd", "h2h_pts"))
+    assert by_gd.rank[:2].tolist() == [1, 2]
+
+
+def test_head_to_head_only_counts_the_tied_players():
+    # three-way tie on points; the mini-league among them decides
+    st = compute_standings(
+        [0, 0, 0],
+        home=[0, 1, 2], away=[1, 2, 0],
+        home_goals=[3, 1, 1], away_goals=[0, 0, 0],
+        order=("pts", "h2h_gd"),
+    )
+    assert st.pts.tolist() == [3, 3, 3]
+    assert st.rank.tolist() == [1, 3, 2]
+
+
+def test_players_level_on_every_key_share_a_rank():
+    st = compute_standings([0, 0], home=[0], away=[1], home_goals=[1], away_goals=[1])
+    assert st.rank.tolist() == [1, 1]
+
+
+def test_groups_rank_independently_and_order_lists_by_group():
+    st = compute_standings(
+        ["B", "B", "A", "A"], home=[0, 2], away=[1, 3],
+        home_goals=[0, 2], away_goals=[1, 0],
+    )
+    assert st.rank.tolist() == [2, 1, 1, 2]
+    assert st.order.tolist() == [2, 3, 1, 0]
+
+
+def test_unknown_tiebreak_key_is_rejected():
+    with pytest.raises(ValueError):
+        compute_standings([0, 0], [0], [1], [1], [0], order=("pts", "coin"))
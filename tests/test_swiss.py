@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from engine.swiss import pair_round
+
+
+def _pairs(rnd):
+    return {frozenset(p) for p in zip(rnd.home.tolist(), rnd.away.tolist())}
+
+
+def test_everyone_paired_once_with_even_field():
+    rnd = pair_round(np.zeros(8))
+    players = np.concatenate([rnd.home, rnd.away])
+    assert sorted(players.tolist()) == list(range(8))
+    assert rnd.bye == -1
+
+
+@pytest.mark.parametrize("n", [8, 15, 16, 20])
+@pytest.mark.parametrize("seed", range(5))
+def test_no_rematches_over_a_swiss_event(n, seed):
+    # the usual ceil(log2 n) rounds plus one, with random results
+    score = np.zeros(n)
+    had_bye = np.zeros(n, dtype=bool)
+    played = []
+    rng = np.random.default_rng(seed)
+    for _ in range(int(np.ceil(np.log2(n))) + 1):
+        rnd = pair_round(score, played_pairs=played, had_bye=had_bye)
+        assert rnd.rematches == 0
+        assert not (_pairs(rnd) & {frozenset(p) for p in played})
+        played += list(zip(rnd.home.tolist(), rnd.away.tolist()))
+        if rnd.bye >= 0:
+            assert not had_bye[rnd.bye]
+            had_bye[rnd.bye] = True
+        winners = np.where(rng.random(len(rnd.home)) < 0.5, rnd.home, rnd.away)
+        score[winners] += 3
+
+
+def test_leaders_meet_leaders():
+    rnd = pair_round([9, 9, 6, 6, 3, 3, 0, 0])
+    assert _pairs(rnd) == {frozenset(p) for p in [(0, 1), (2, 3), (4, 5), (6, 7)]}
+
+
+def test_same_club_pairing_avoided_when_possible():
+    rnd = pair_round(np.zeros(4), club=["x", "x", "y", "y"])
+    assert rnd.club_clashes == 0
+    assert frozenset((0, 1)) not in _pairs(rnd)
+
+
+def test_bye_goes_to_lowest_player_without_one():
+    score = [6, 3, 3, 0, 0]
+    assert pair_round(score).bye == 4
+    assert pair_round(score, had_bye=[False, False, False, False, True]).bye == 3
+
+
+def test_fewer_home_games_plays_at_home():
+    rnd = pair_round([3, 0], home_count=[2, 0])
+    assert rnd.home.tolist() == [1]
+    assert rnd.away.tolist() == [0]
@@ -1,7 +1,11 @@
 import os
+import time
 import snowflake.connector
 import mysql.connector
+from mysql.connector import pooling
 import streamlit as st
+from contextlib import closing
+from dataclasses import dataclass
 from datetime import date
 
 # Snowflake connection from st.secrets
@@ -15,43 +19,145 @@ def get_db_connectionX():
         schema=st.secrets["snowflake"]["schema"]
     )
 
-# MySQL connection from st.secrets
-def get_db_connection():
-    return mysql.connector.connect(
-        host=st.secrets["mysql"]["host"],
-        port=st.secrets["mysql"]["port"],
-        user=st.secrets["mysql"]["user"],
-        password=st.secrets["mysql"]["password"],
-        database=st.secrets["mysql"]["database"]
+# MySQL connection pool from st.secrets
+#
+# Optional [mysql] keys:
+#   pool_name     – name of the pool (default "xabuteo")
+#   pool_size     – connections held open per server process (default 5, max 32)
+#   pool_timeout  – seconds to wait for a free connection before failing (default 10)
+#   connect_timeout – seconds allowed for a single connect / reconnect (default 10)
+@st.cache_resource(show_spinner=False)
+def get_db_pool() -> pooling.MySQLConnectionPool:
+    """Create the process-wide MySQL pool once per server."""
+    cfg = st.secrets["mysql"]
+    return pooling.MySQLConnectionPool(
+        pool_name=cfg.get("pool_name", "xabuteo"),
+        pool_size=max(1, min(int(cfg.get("pool_size", 5)), pooling.CNX_POOL_MAXSIZE)),
+        pool_reset_session=True,
+        host=cfg["host"],
+        port=cfg["port"],
+        user=cfg["user"],
+        password=cfg["password"],
+        database=cfg["database"],
+        connection_timeout=int(cfg.get("connect_timeout", 10)),
+        # pooled connections are reused, so never hand one back with unread rows
+        buffered=True,
     )
 
+def get_db_connection():
+    """Check a connection out of the pool.
+
+    ``close()`` on the returned connection hands it back to the pool (after a
+    session reset), so ``conn.close()`` and ``closing(get_db_connection())``
+    keep working unchanged.  Stale connections are pinged and reconnected by
+    the pool on checkout; if the pool is exhausted or a reconnect fails we
+    retry until ``pool_timeout`` runs out.
+    """
+    pool = get_db_pool()
+    deadline = time.monotonic() + float(st.secrets["mysql"].get("pool_timeout", 10))
+    while True:
+        try:
+            return pool.get_connection()
+        except (mysql.connector.errors.PoolError, mysql.connector.errors.InterfaceError):
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(0.05)
+
+# Identity / authorization context, resolved once per login session
+IDENTITY_TTL_SECONDS = 300
+
+@dataclass(frozen=True)
+class Identity:
+    """Who the current user is and what they may administer today."""
+    email: str
+    user_id: int | None
+    profile_complete: bool
+    admin_club_ids: tuple
+    as_of: date
+    loaded_at: float
+
+@st.cache_resource(show_spinner=False)
+def _identity_versions() -> dict:
+    """Process-wide {email: version} so one session can invalidate another."""
+    return {}
+
+def _load_identity(email: str) -> Identity:
+    today = date.today()
+    with closing(get_db_connection()) as conn, closing(conn.cursor()) as cursor:
+        # one round trip: the profile row plus any admin clubs valid today
+        cursor.execute("""
+            SELECT r.id, r.first_name, r.last_name, r.date_of_birth, r.gender,
+                   cua.club_id
+            FROM registrations r
+            LEFT JOIN club_user_admin cua
+              ON cua.user_id = r.id
+             AND %s BETWEEN cua.valid_from AND cua.valid_to
+            WHERE r.email = %s
+        """, (today, email))
+        rows = cursor.fetchall()
+
+    if not rows:
+        return Identity(email, None, False, (), today, time.monotonic())
+
+    profile = rows[0][:5]
+    club_ids = tuple(sorted({row[5] for row in rows if row[5] is not None}))
+    return Identity(email, profile[0], all(profile), club_ids, today, time.monotonic())
+
+def get_identity(refresh: bool = False) -> Identity | None:
+    """Return the cached identity for the logged-in user (None if logged out).
+
+    The identity lives in ``st.session_state`` and is reloaded when it is
+    older than ``IDENTITY_TTL_SECONDS``, when the day rolls over (admin
+    validity is date based) or after ``invalidate_identity``.
+    """
+    email = getattr(getattr(st, "user", None), "email", None)
+    if not email:
+        return None
+
+    version = _identity_versions().get(email.lower(), 0)
+    cached = st.session_state.get("identity")
+    if (
+        not refresh
+        and cached is not None
+        and cached[0] == version
+        and cached[1].email == email
+        and cached[1].as_of == date.today()
+        and time.monotonic() - cached[1].loaded_at < IDENTITY_TTL_SECONDS
+    ):
+        return cached[1]
+
+    identity = _load_identity(email)
+    st.session_state["identity"] = (version, identity)
+    return identity
+
+def invalidate_identity(email: str | None = None) -> None:
+    """Drop cached identities for ``email`` (default: the current user).
+
+    Call after writing ``registrations`` or ``club_user_admin``; every session
+    of that user reloads its identity on the next rerun.
+    """
+    email = email or getattr(getattr(st, "user", None), "email", None)
+    if email:
+        versions = _identity_versions()
+        versions[email.lower()] = versions.get(email.lower(), 0) + 1
+    st.session_state.pop("identity", None)
+
 def ensure_profile_complete():
     """Check that the current user's profile is complete in the registrations table."""
     if not st.user.is_logged_in:
         st.warning("🔐 You are not logged in.")
         st.stop()
 
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
     try:
-        cursor.execute("""
-            SELECT id, first_name, last_name, date_of_birth, gender
-            FROM registrations
-            WHERE email = %s
-        """, (st.user.email,))
-        row = cursor.fetchone()
-
-        if not row or not all(row):
-            st.warning("⚠️ Your profile is incomplete. Please complete it before continuing.")
-            #st.markdown("➡️ [Go to your profile page](./2_Profile)")
-            st.stop()
+        identity = get_identity()
     except Exception as e:
         st.error(f"❌ Failed to verify profile: {e}")
         st.stop()
-    finally:
-        cursor.close()
-        conn.close()
+
+    if not identity or not identity.profile_complete:
+        st.warning("⚠️ Your profile is incomplete. Please complete it before continuing.")
+        #st.markdown("➡️ [Go to your profile page](./2_Profile)")
+        st.stop()
 
 def get_userid():
     try:
@@ -59,54 +165,12 @@ def get_userid():
             st.warning("User not logged in or email not available.")
             return None
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        query = """
-            SELECT id
-            FROM registrations
-            WHERE email = %s
-        """
-        cursor.execute(query, (st.user.email,))
-        row = cursor.fetchone()
-
-        return row[0] if row else None
+        return get_identity().user_id
 
     except Exception as e:
         st.error(f"Error fetching user ID: {e}")
         return None
 
-    finally:
-        try:
-            cursor.close()
-            conn.close()
-        except:
-            pass
-
 def get_admin_club_ids() -> list:
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    try:
-        # Get user ID from registrations table
-        cursor.execute("""
-            SELECT id FROM registrations WHERE email = %s
-        """, (st.user.email,))
-        user_row = cursor.fetchone()
-        if not user_row:
-            return []  # User not found
-
-        user_id = user_row[0]
-
-        # Get active admin club_ids
-        cursor.execute("""
-            SELECT club_id FROM club_user_admin 
-            WHERE user_id = %s
-            AND %s BETWEEN valid_from AND valid_to
-        """, (user_id, date.today()))
-        admin_club_rows = cursor.fetchall()
-
-        return [row[0] for row in admin_club_rows]
-
-    finally:
-        cursor.close()
-        conn.close()
+    identity = get_identity()
+    return list(identity.admin_club_ids) if identity else []
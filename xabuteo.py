@@ -2,7 +2,7 @@
 
 import streamlit as st
 from datetime import datetime
-from utils import get_db_connection, ensure_profile_complete
+from utils import get_db_connection, ensure_profile_complete, invalidate_identity
 
 query_params = st.query_params
 
@@ -58,6 +58,8 @@ else:
         result = cursor.fetchone()
     
         now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        # identity fields written (not just the login timestamps)
+        identity_changed = result is None
     
         if result is None:
             # Insert new user
@@ -88,6 +90,7 @@ else:
                 params.append(last_name)
             if not existing_registered or str(existing_registered) in ("0000-00-00", "None"):
                 updates.append("date_registered = CURDATE()")
+            identity_changed = bool(updates)
     
             # Always update last_login and updated_by
             updates.append("last_login = %s")
@@ -106,6 +109,8 @@ else:
             cursor.execute(sql, params)
     
         conn.commit()
+        if identity_changed:
+            invalidate_identity(email)
     finally:
         cursor.close()
         conn.close()